@@ -1,16 +1,378 @@
 from models import Student, Instructor, Course
+import re
 import sys
 import sqlite3
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QLineEdit, QPushButton, QWidget, QVBoxLayout,
-    QFormLayout, QMessageBox, QComboBox, QInputDialog, QTableWidget,
-    QTableWidgetItem, QHBoxLayout, QSizePolicy, QFileDialog
+    QFormLayout, QMessageBox, QComboBox, QInputDialog, QTableView,
+    QHBoxLayout, QSizePolicy, QFileDialog
+)
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QTimer, QObject, QThreadPool, pyqtSignal
 )
-from PyQt5.QtCore import Qt
 import database as dbapi
 
 CONTENT_WIDTH = 520
 
+# Email format accepted by the add forms, compiled once for every click.
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
+# Number of rows the table model reads from the database at a time.
+PAGE_SIZE = 200
+
+# Students with their registered course names aggregated in one row each, in table column order.
+# The names come from a correlated subquery (an idx_reg_student_course lookup per student) instead of a join + GROUP BY,
+# so a LIMIT page only aggregates the rows it returns. The ordered inner query keeps the names sorted in GROUP_CONCAT.
+STUDENTS_WITH_COURSES_SQL = """
+    SELECT s.name, s.age, s.email, s.student_id, COALESCE((
+        SELECT GROUP_CONCAT(course_name, ', ') FROM (
+            SELECT c.course_name
+            FROM registrations r JOIN courses c ON c.course_id=r.course_id
+            WHERE r.student_id=s.student_id
+            ORDER BY c.course_name
+        )
+    ), '')
+    FROM students s
+"""
+
+# Courses with their instructor name and enrolled student names aggregated in one row each, in table column order.
+COURSES_WITH_STUDENTS_SQL = """
+    SELECT c.course_id, c.course_name, COALESCE(i.name, ''), COALESCE((
+        SELECT GROUP_CONCAT(name, ', ') FROM (
+            SELECT s.name
+            FROM registrations r JOIN students s ON s.student_id=r.student_id
+            WHERE r.course_id=c.course_id
+            ORDER BY s.name
+        )
+    ), '')
+    FROM courses c
+    LEFT JOIN instructors i ON i.instructor_id=c.instructor_id
+"""
+
+# Search queries of each view, ?1 is the FTS5 MATCH query built by dbapi.fts_query.
+# students match on their own fields or on the name/id of a registered course,
+# courses on their own fields, on their instructor or on the name/id of an enrolled student.
+SEARCH_SQL = {
+    'students': STUDENTS_WITH_COURSES_SQL + """
+        WHERE s.rowid IN (SELECT rowid FROM students_fts WHERE students_fts MATCH ?1)
+           OR EXISTS (
+               SELECT 1 FROM registrations r JOIN courses c ON c.course_id=r.course_id
+               WHERE r.student_id=s.student_id
+                 AND c.rowid IN (SELECT rowid FROM courses_fts WHERE courses_fts MATCH ?1))
+        ORDER BY s.name, s.student_id""",
+    'instructors': """
+        SELECT name, age, email, instructor_id FROM instructors
+        WHERE rowid IN (SELECT rowid FROM instructors_fts WHERE instructors_fts MATCH ?1)
+        ORDER BY name, instructor_id""",
+    'courses': COURSES_WITH_STUDENTS_SQL + """
+        WHERE c.rowid IN (SELECT rowid FROM courses_fts WHERE courses_fts MATCH ?1)
+           OR i.rowid IN (SELECT rowid FROM instructors_fts WHERE instructors_fts MATCH ?1)
+           OR EXISTS (
+               SELECT 1 FROM registrations r JOIN students s ON s.student_id=r.student_id
+               WHERE r.course_id=c.course_id
+                 AND s.rowid IN (SELECT rowid FROM students_fts WHERE students_fts MATCH ?1))
+        ORDER BY c.course_name, c.course_id""",
+}
+
+
+class SchoolTableModel(QAbstractTableModel):
+    '''
+    Functionality: this class is the table model behind the main table view. it keeps the rows of the current view
+    as a plain list of tuples and the column headers as a list of strings, so refreshing the table is a single
+    model reset instead of creating one widget item per cell.
+    when the rows come from a query, the cursor stays open and the rows are read lazily PAGE_SIZE at a time
+    with fetchmany as the user scrolls (canFetchMore/fetchMore), so the first page shows up right away whatever
+    the size of the table and the query is never re-run to reach the next page.
+
+    Attributes:
+        _rows of type list[tuple]: the rows of the current view loaded so far.
+        _headers of type list[str]: the column headers of the current view.
+        _cursor (sqlite3.Cursor | None): open cursor of the current query until all its rows are read.
+        _exhausted (bool): True once every row of the query has been read.
+    '''
+
+    def __init__(self, parent=None):
+        '''
+        Functionality: it initializes an empty model.
+
+        Parameter: parent is the optional parent QObject.
+
+        Return Value: None
+        '''
+        super().__init__(parent)
+        self._rows = []
+        self._headers = []
+        self._cursor = None
+        self._exhausted = True
+
+    def rowCount(self, parent=QModelIndex()):
+        '''
+        Return Value: the number of rows of the current view (0 for child indexes since the model is flat).
+        '''
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        '''
+        Return Value: the number of columns of the current view.
+        '''
+        if parent.isValid():
+            return 0
+        return len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        '''
+        Functionality: it returns the value of a cell. the rows keep the values as read from the database
+        (ages stay integers), they are only turned into text when a cell is drawn.
+
+        Parameter: index is the cell position and role is the Qt item data role.
+
+        Return Value: the cell value as a string for the display role, None otherwise.
+        '''
+        if not index.isValid():
+            return None
+        value = self._rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return value if isinstance(value, str) else str(value)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        '''
+        Functionality: it returns the column headers; rows are numbered by Qt itself.
+
+        Return Value: the header text for horizontal headers, the default for the rest.
+        '''
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, headers, rows):
+        '''
+        Functionality: it replaces the content of the model and notifies the view with one model reset.
+        when the headers and the number of rows don't change, the rows are swapped in place and the view only
+        repaints the cells (dataChanged), so it keeps its header, scroll position and selection.
+
+        Parameter: headers is the list of column headers and rows is the list of tuples to show.
+
+        Return Value: None
+        '''
+        headers = list(headers)
+        rows = list(rows)
+        self._close_cursor()
+        if headers == self._headers and len(rows) == len(self._rows):
+            self._rows = rows
+            if rows:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, len(headers) - 1), [Qt.DisplayRole])
+            return
+        self.beginResetModel()
+        self._headers = headers
+        self._rows = rows
+        self.endResetModel()
+
+    def set_query(self, con, headers, sql, params=()):
+        '''
+        Functionality: it makes the model show the result of a query; only the first page is read now,
+        the next ones are read by fetchMore when the view needs them.
+
+        Parameter: this function has 4 parameters
+        1. con: the sqlite3 connection to read from.
+        2. headers: the list of column headers.
+        3. sql: the SELECT returning the rows in column order.
+        4. params: the parameters of the query.
+
+        Return Value: None
+        '''
+        self._close_cursor()
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._rows = []
+        self._cursor = con.execute(sql, tuple(params))
+        self._cursor.arraysize = PAGE_SIZE
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def _close_cursor(self):
+        '''
+        Functionality: it closes the cursor of the previous query, which ends its read of the database.
+
+        Return Value: None
+        '''
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+        self._exhausted = True
+
+    def canFetchMore(self, parent=QModelIndex()):
+        '''
+        Return Value: True while the query of the current view still has rows that were not read.
+        '''
+        if parent.isValid():
+            return False
+        return not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        '''
+        Functionality: it reads the next PAGE_SIZE rows of the query and appends them to the model.
+
+        Parameter: parent is the index Qt asks rows for (always the root for this flat model).
+
+        Return Value: None
+        '''
+        if parent.isValid() or self._exhausted:
+            return
+        rows = self._cursor.fetchmany()
+        if len(rows) < PAGE_SIZE:
+            self._close_cursor()
+        if rows:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+    def headers(self):
+        '''
+        Return Value: the column headers of the current view.
+        '''
+        return list(self._headers)
+
+    def row_at(self, row):
+        '''
+        Return Value: the tuple stored at the given row.
+        '''
+        return self._rows[row]
+
+    def update_row(self, row, values):
+        '''
+        Functionality: it replaces one row and repaints only that row.
+
+        Parameter: row is the row number in the model and values is the new tuple in column order.
+
+        Return Value: None
+        '''
+        self._rows[row] = tuple(values)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._headers) - 1))
+
+    def remove_row(self, row):
+        '''
+        Functionality: it removes one row from the model.
+
+        Parameter: row is the row number in the model.
+
+        Return Value: None
+        '''
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+
+def write_csv(con, path, headers, sql):
+    '''
+    Functionality: it writes the headers and the result of a query to a csv file.
+    the rows go from the cursor straight to a 1 MiB buffered file, the result set is never held in memory.
+
+    Parameter: this function has 4 parameters
+    1. con: the sqlite3 connection to read from.
+    2. path: the path of the csv file.
+    3. headers: the list of column headers.
+    4. sql: the SELECT returning the rows in column order.
+
+    Return Value: it returns the message shown to the user once the export is done.
+    '''
+    import csv
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(headers)
+        for row in con.execute(sql):
+            w.writerow(row)
+    return f"Data exported to {path}"
+
+
+def write_json_snapshot(con, path):
+    '''
+    Functionality: it builds a SchoolDB instance from the sqlite content and serializes it to a JSON file.
+
+    Parameter: this function has 2 parameters
+    1. con: the sqlite3 connection to read from.
+    2. path: the path of the JSON file.
+
+    Return Value: it returns the message shown to the user once the snapshot is saved.
+    '''
+    from models import SchoolDB
+    sdb = SchoolDB()
+    cur = con.cursor()
+    # the loops iterate the cursor, so rows are stepped as they are used instead of fetched into one list per table
+    # Read every registration and course assignment once and group them in Python
+    # instead of running one sub-SELECT per student, instructor and course.
+    stu_courses = {}
+    course_students = {}
+    cur.execute("SELECT r.student_id, r.course_id, c.course_name FROM registrations r JOIN courses c ON c.course_id=r.course_id")
+    for sid, cid, cname in cur:
+        stu_courses.setdefault(sid, []).append(cname)
+        course_students.setdefault(cid, []).append(sid)
+    instr_courses = {}
+    cur.execute("SELECT instructor_id, course_name FROM courses WHERE instructor_id IS NOT NULL")
+    for iid, cname in cur:
+        instr_courses.setdefault(iid, []).append(cname)
+
+    cur.execute("SELECT student_id, name, age, email FROM students")
+    for sid, name, age, email in cur:
+        s = Student(name, age, email, sid)
+        s.registered_courses = stu_courses.get(sid, [])
+        sdb.students[sid] = s
+    cur.execute("SELECT instructor_id, name, age, email FROM instructors")
+    for iid, name, age, email in cur:
+        ins = Instructor(name, age, email, iid)
+        ins.assigned_courses = instr_courses.get(iid, [])
+        sdb.instructors[iid] = ins
+    cur.execute("SELECT course_id, course_name, instructor_id FROM courses")
+    for cid, cname, iid in cur:
+        instr = sdb.instructors.get(iid) if iid else None
+        c = Course(cid, cname, instr)
+        for sid in course_students.get(cid, []):
+            if sid in sdb.students:
+                c.enrolled_students.append(sdb.students[sid])
+        sdb.courses[cid] = c
+    sdb.save_json(path)
+    return f"JSON snapshot saved to {path}"
+
+
+class ExportWorker(QObject):
+    '''
+    Functionality: this class runs an export job (write_csv or write_json_snapshot) on a QThreadPool thread
+    so the window keeps repainting while the database is read and the file is written.
+    the job borrows a connection from the dbapi pool because the window's connections must not be used from another thread.
+
+    Attributes:
+        finished (pyqtSignal(str)): emitted with the success message once the job is done.
+        failed (pyqtSignal(str)): emitted with the error message if the job raised.
+    '''
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, job, *args):
+        '''
+        Functionality: it stores the job and its arguments, the connection is passed to the job before them.
+        '''
+        super().__init__()
+        self._job = job
+        self._args = args
+
+    def run(self):
+        '''
+        Functionality: it borrows a pooled connection, runs the job and emits finished or failed.
+
+        Return Value: None
+        '''
+        try:
+            with dbapi.borrow() as con:
+                message = self._job(con, *self._args)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(message)
+
+
 class MainWindow(QMainWindow):
     '''
     Main application window for the School Management System.
@@ -25,7 +387,8 @@ class MainWindow(QMainWindow):
 
     Attributes:
         current_view of type string: Active table view ('students' | 'instructors' | 'courses').
-        table (QTableWidget): Main table widget showing the current view.
+        table (QTableView): Main table view showing the current view.
+        model (SchoolTableModel): Model holding the rows of the current view.
         # Form inputs (selected examples below):
         student_name (QLineEdit)
         student_age (QLineEdit)
@@ -44,16 +407,25 @@ class MainWindow(QMainWindow):
         assign_course_dropdown (QComboBox)
         search_input (QLineEdit)
 
-    Methods: we have 19 methods
+    Methods: we have 35 methods
         __init__(): Build and lay out the UI; initialize dropdowns and default view.
+        closeEvent(): Close the database connections with the window.
+        _bootstrap_load(): Fill the startup dropdowns and show the students.
+        _fill_dropdown(): Replace the items of a dropdown in one batch.
+        _add_to_dropdowns(): Insert a newly added record in its dropdowns.
         update_course_dropdown(): Refresh registration course dropdown from DB.
         register_student_to_course(): Register a given student to the selected course.
-        export_to_csv(): Export the current table view to a CSV file.
-        save_data(): Serialize the entire DB to JSON via SchoolDB model.
+        export_to_csv(): Export the current table view to a CSV file in the background.
+        save_data(): Serialize the entire DB to JSON via SchoolDB model in the background.
+        _start_export(): Run an export job on the thread pool and disable the export buttons.
+        _export_finished() / _export_failed(): Re-enable the export buttons and report the result.
         load_data(): Load JSON snapshot into the DB (upsert-like behavior).
         get_selected_row(): Return the currently selected row index or None.
         edit_selected_record(): Edit the selected record depending on current_view.
+        _edit_student() / _edit_instructor() / _edit_course(): Edit one record and update its table row.
         delete_selected_record(): Delete the selected record depending on current_view.
+        _delete_student() / _delete_instructor() / _delete_course(): Delete one record and remove its table row.
+        _fill_model(): Load a view into the table model with repaints held back.
         display_students(): Populate table with students (optionally a provided list).
         display_instructors(): Populate table with instructors (optionally a list).
         display_courses(): Populate table with courses (optionally a list).
@@ -66,6 +438,63 @@ class MainWindow(QMainWindow):
         add_course(): Validate and create a new course.
     '''
 
+    def _bootstrap_load(self):
+        '''
+        Functionality: it fills the dropdowns and the students view at startup, the instructor and course lists
+        are read once through dbapi and every dropdown listing them is filled from that copy, then the first page
+        of students is shown.
+
+        Parameter: None
+
+        Return Value: None
+        '''
+        self.update_instructor_dropdowns()
+        self.update_assign_course_dropdown()
+        self.update_course_dropdown()
+        self.display_students()
+
+    def _add_to_dropdowns(self, rows, record_id, dropdowns):
+        '''
+        Functionality: after a record is added, it inserts it in the dropdowns at its place in the name order,
+        instead of refilling the dropdowns with the whole list.
+
+        Parameter: this function has 3 parameters
+        1. rows: dbapi.list_instructors() or dbapi.list_courses() read after the record was added, (id, name, ...) rows.
+        2. record_id: the id of the added record.
+        3. dropdowns: the dropdowns listing this table, holding every row but the new one.
+
+        Return Value: True if the dropdowns were updated, False if the record isn't in rows and they need a full refresh.
+        '''
+        for pos, row in enumerate(rows):
+            if row[0] == record_id:
+                break
+        else:
+            return False
+        for dropdown in dropdowns:
+            dropdown.insertItem(pos, f"{row[1]} ({row[0]})", row[0])
+        return True
+
+    def _fill_dropdown(self, dropdown, labels, ids):
+        '''
+        Functionality: it replaces the items of a dropdown in one batch; signals are blocked while the items
+        are swapped so the combo box doesn't emit and repaint once per added item.
+
+        Parameter: this function has 3 parameters
+        1. dropdown: the QComboBox to refill.
+        2. labels: the texts shown in the dropdown.
+        3. ids: the id stored as item data for each label.
+
+        Return Value: None
+        '''
+        dropdown.blockSignals(True)
+        try:
+            dropdown.clear()
+            dropdown.addItems(labels)
+            for i, item_id in enumerate(ids):
+                dropdown.setItemData(i, item_id)
+        finally:
+            dropdown.blockSignals(False)
+
     def update_course_dropdown(self):
         '''
         Functionality: it refreshes the courses dropdown that we are using for the student registration
@@ -74,9 +503,8 @@ class MainWindow(QMainWindow):
 
         Return Value: None but the function clear and repopulate self.reg_course_dropdown with the name and id of the course.
         '''
-        self.reg_course_dropdown.clear()
-        for cid, cname, _ in dbapi.list_courses():
-            self.reg_course_dropdown.addItem(f"{cname} ({cid})", cid)
+        courses = dbapi.list_courses()
+        self._fill_dropdown(self.reg_course_dropdown, [f"{cname} ({cid})" for cid, cname, _ in courses], [cid for cid, _, _ in courses])
 
     def register_student_to_course(self):
         '''
@@ -102,14 +530,10 @@ class MainWindow(QMainWindow):
         if not dbapi.read_course(course_id):
             QMessageBox.warning(self, "Error", "Course not found!")
             return
-        with sqlite3.connect("database.db") as con:
-            cur = con.cursor()
-            cur.execute("SELECT 1 FROM registrations WHERE student_id=? AND course_id=?", (student_id, course_id))
-            exists = cur.fetchone()
-        if exists:
+        # the unique (student_id, course_id) index rejects a duplicate
+        if not dbapi.try_create_registration(student_id, course_id):
             QMessageBox.information(self, "Info", "Student already registered for this course.")
             return
-        dbapi.create_registration(student_id, course_id)
         QMessageBox.information(self, "Success", "Student registered for course!")
         if self.current_view == 'students':
             self.display_students()
@@ -130,6 +554,23 @@ class MainWindow(QMainWindow):
         Return value: None but the function initializes the dropdowns and renders the default students view.
         '''
         super().__init__()
+        # Writes go through dbapi and its shared connection. The table view reads from its own read-only
+        # connection: its cursor stays open while the user scrolls through a view, so it is kept apart
+        # from the connection the writes are committed on.
+        self._view_con = sqlite3.connect("file:database.db?mode=ro", uri=True, check_same_thread=False, cached_statements=256)
+        self._view_con.execute("PRAGMA mmap_size=268435456")
+        # edit/delete handlers of the selected row for each view
+        self._edit_handlers = {
+            'students': self._edit_student,
+            'instructors': self._edit_instructor,
+            'courses': self._edit_course,
+        }
+        self._delete_handlers = {
+            'students': self._delete_student,
+            'instructors': self._delete_instructor,
+            'courses': self._delete_course,
+        }
+
         self.setWindowTitle("School Management System")
         self.setGeometry(100, 100, 900, 800)
 
@@ -205,9 +646,10 @@ class MainWindow(QMainWindow):
         layout.addLayout(assign_form)
 
         table_layout = QHBoxLayout()
-        self.table = QTableWidget()
-        self.table.setColumnCount(1)
-        self.table.setRowCount(0)
+        self.table = QTableView()
+        self.model = SchoolTableModel(self)
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         self.table.setFixedWidth(CONTENT_WIDTH)
         self.table.setFixedHeight(240)
         self.table.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
@@ -221,6 +663,12 @@ class MainWindow(QMainWindow):
         self.search_btn = QPushButton("Search")
         self.search_btn.clicked.connect(self.search_records)
         search_layout.addWidget(self.search_btn)
+        # filter while typing, but only once the user pauses for 150 ms
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.search_records)
+        self.search_input.textChanged.connect(lambda _: self._search_timer.start())
         layout.addLayout(search_layout)
 
         btn_layout = QHBoxLayout()
@@ -253,14 +701,25 @@ class MainWindow(QMainWindow):
         file_layout.addWidget(self.load_btn)
         self.export_btn = QPushButton("Export to CSV")
         self.export_btn.clicked.connect(self.export_to_csv)
+        self._export_worker = None
         file_layout.addWidget(self.export_btn)
         layout.addLayout(file_layout)
 
         self.current_view = 'students'
-        self.update_instructor_dropdowns()
-        self.update_assign_course_dropdown()
-        self.update_course_dropdown()
-        self.display_students()
+        self._bootstrap_load()
+
+    def closeEvent(self, event):
+        '''
+        Functionality: it waits for a running export to finish writing its file and closes the database connections when the window is closed.
+
+        Parameter: event is the QCloseEvent sent by Qt.
+
+        Return Value: None
+        '''
+        QThreadPool.globalInstance().waitForDone()
+        self.model.set_rows([], [])
+        self._view_con.close()
+        super().closeEvent(event)
 
     def export_to_csv(self):
         '''
@@ -273,56 +732,22 @@ class MainWindow(QMainWindow):
 
         Return Value: None but if an error occured then it will display a message box telling the user that the function failed.
         '''
-        import csv
         path, _ = QFileDialog.getSaveFileName(self, "Export to CSV", "records.csv", "CSV Files (*.csv)")
         if not path:
             return
-        try:
-            if self.current_view == 'students':
-                headers = ["Name", "Age", "Email", "Student ID", "Registered Courses"]
-                rows = []
-                with sqlite3.connect("database.db") as con:
-                    cur = con.cursor()
-                    cur.execute("SELECT student_id, name, age, email FROM students ORDER BY name")
-                    for sid, name, age, email in cur.fetchall():
-                        cur.execute(
-                            "SELECT c.course_name FROM registrations r JOIN courses c ON c.course_id=r.course_id WHERE r.student_id=? ORDER BY c.course_name",
-                            (sid,),
-                        )
-                        courses = ", ".join([r[0] for r in cur.fetchall()])
-                        rows.append([name, age, email, sid, courses])
-            elif self.current_view == 'instructors':
-                headers = ["Name", "Age", "Email", "Instructor ID"]
-                rows = []
-                for iid, name, age, email in dbapi.list_instructors():
-                    rows.append([name, age, email, iid])
-            elif self.current_view == 'courses':
-                headers = ["Course ID", "Course Name", "Instructor", "Enrolled Students"]
-                rows = []
-                with sqlite3.connect("database.db") as con:
-                    cur = con.cursor()
-                    cur.execute("""
-                        SELECT c.course_id, c.course_name, COALESCE(i.name,'')
-                        FROM courses c LEFT JOIN instructors i ON i.instructor_id=c.instructor_id
-                        ORDER BY c.course_name
-                    """)
-                    for cid, cname, iname in cur.fetchall():
-                        cur.execute(
-                            "SELECT s.name FROM registrations r JOIN students s ON s.student_id=r.student_id WHERE r.course_id=? ORDER BY s.name",
-                            (cid,),
-                        )
-                        students = ", ".join([r[0] for r in cur.fetchall()])
-                        rows.append([cid, cname, iname, students])
-            else:
-                QMessageBox.warning(self, "Error", "No data to export.")
-                return
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                w = csv.writer(f)
-                w.writerow(headers)
-                w.writerows(rows)
-            QMessageBox.information(self, "Success", f"Data exported to {path}")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to export: {e}")
+        if self.current_view == 'students':
+            headers = ["Name", "Age", "Email", "Student ID", "Registered Courses"]
+            sql = STUDENTS_WITH_COURSES_SQL + " ORDER BY s.name"
+        elif self.current_view == 'instructors':
+            headers = ["Name", "Age", "Email", "Instructor ID"]
+            sql = "SELECT name, age, email, instructor_id FROM instructors"
+        elif self.current_view == 'courses':
+            headers = ["Course ID", "Course Name", "Instructor", "Enrolled Students"]
+            sql = COURSES_WITH_STUDENTS_SQL + " ORDER BY c.course_name"
+        else:
+            QMessageBox.warning(self, "Error", "No data to export.")
+            return
+        self._start_export(write_csv, path, headers, sql)
 
     def save_data(self):
         '''
@@ -333,39 +758,43 @@ class MainWindow(QMainWindow):
 
         Return Value: None but will show a message box on exceptions. 
         '''
-        from models import SchoolDB
         path, _ = QFileDialog.getSaveFileName(self, "Export JSON Snapshot", "data.json", "JSON Files (*.json)")
         if not path:
             return
-        try:
-            sdb = SchoolDB()
-            with sqlite3.connect("database.db") as con:
-                cur = con.cursor()
-                cur.execute("SELECT student_id, name, age, email FROM students")
-                for sid, name, age, email in cur.fetchall():
-                    s = Student(name, age, email, sid)
-                    cur.execute("SELECT c.course_name FROM registrations r JOIN courses c ON c.course_id=r.course_id WHERE r.student_id=?", (sid,))
-                    s.registered_courses = [r[0] for r in cur.fetchall()]
-                    sdb.students[sid] = s
-                cur.execute("SELECT instructor_id, name, age, email FROM instructors")
-                for iid, name, age, email in cur.fetchall():
-                    ins = Instructor(name, age, email, iid)
-                    cur.execute("SELECT course_name FROM courses WHERE instructor_id=?", (iid,))
-                    ins.assigned_courses = [r[0] for r in cur.fetchall()]
-                    sdb.instructors[iid] = ins
-                cur.execute("SELECT course_id, course_name, instructor_id FROM courses")
-                for cid, cname, iid in cur.fetchall():
-                    instr = sdb.instructors.get(iid) if iid else None
-                    c = Course(cid, cname, instr)
-                    cur.execute("SELECT s.student_id, s.name FROM registrations r JOIN students s ON s.student_id=r.student_id WHERE r.course_id=?", (cid,))
-                    for sid, name in cur.fetchall():
-                        if sid in sdb.students:
-                            c.enrolled_students.append(sdb.students[sid])
-                    sdb.courses[cid] = c
-            sdb.save_json(path)
-            QMessageBox.information(self, "Success", f"JSON snapshot saved to {path}")
-        except Exception as e:
-            QMessageBox.warning(self, "Error", str(e))
+        self._start_export(write_json_snapshot, path)
+
+    def _start_export(self, job, *args):
+        '''
+        Functionality: it runs an export job in the background and disables the export buttons until it is done.
+
+        Parameter: job is write_csv or write_json_snapshot and args are its arguments after the connection.
+
+        Return Value: None
+        '''
+        self._export_worker = ExportWorker(job, *args)
+        self._export_worker.finished.connect(self._export_finished)
+        self._export_worker.failed.connect(self._export_failed)
+        self.export_btn.setEnabled(False)
+        self.save_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(self._export_worker.run)
+
+    def _export_finished(self, message):
+        '''
+        Functionality: it re-enables the export buttons and tells the user the export succeeded.
+        '''
+        self._export_worker = None
+        self.export_btn.setEnabled(True)
+        self.save_btn.setEnabled(True)
+        QMessageBox.information(self, "Success", message)
+
+    def _export_failed(self, message):
+        '''
+        Functionality: it re-enables the export buttons and tells the user the export failed.
+        '''
+        self._export_worker = None
+        self.export_btn.setEnabled(True)
+        self.save_btn.setEnabled(True)
+        QMessageBox.warning(self, "Error", f"Failed to export: {message}")
 
     def load_data(self):
         '''
@@ -383,29 +812,14 @@ class MainWindow(QMainWindow):
             return
         try:
             sdb = SchoolDB.load_json(path)
-            with sqlite3.connect("database.db") as con:
-                cur = con.cursor()
-                for ins in sdb.instructors.values():
-                    try:
-                        dbapi.create_instructor(ins.instructor_id, ins.name, ins.age, ins._email)
-                    except Exception:
-                        pass
-                for s in sdb.students.values():
-                    try:
-                        dbapi.create_student(s.student_id, s.name, s.age, s._email)
-                    except Exception:
-                        pass
-                for c in sdb.courses.values():
-                    iid = c.instructor.instructor_id if c.instructor else None
-                    try:
-                        dbapi.create_course(c.course_id, c.course_name, iid)
-                    except Exception:
-                        pass
-                    for stu in c.enrolled_students:
-                        try:
-                            dbapi.create_registration(stu.student_id, c.course_id)
-                        except Exception:
-                            pass
+            # One transaction for the whole import; rows that already exist are skipped.
+            # from_dictionary only enrolls students of the snapshot, so every pair refers to rows inserted with it
+            dbapi.insert_missing(
+                [(i.instructor_id, i.name, i.age, i._email) for i in sdb.instructors.values()],
+                [(s.student_id, s.name, s.age, s._email) for s in sdb.students.values()],
+                [(c.course_id, c.course_name, c.instructor.instructor_id if c.instructor else None) for c in sdb.courses.values()],
+                [(stu.student_id, c.course_id) for c in sdb.courses.values() for stu in c.enrolled_students],
+            )
             self.update_instructor_dropdowns()
             self.update_assign_course_dropdown()
             self.update_course_dropdown()
@@ -430,11 +844,11 @@ class MainWindow(QMainWindow):
 
         User Feedback: the function will send a warning to the user if no row is selected. 
         '''
-        selected = self.table.currentRow()
-        if selected < 0:
+        index = self.table.currentIndex()
+        if not index.isValid():
             QMessageBox.warning(self, "Error", "No record selected!")
             return None
-        return selected
+        return index.row()
 
     def edit_selected_record(self):
         '''
@@ -453,57 +867,91 @@ class MainWindow(QMainWindow):
         row = self.get_selected_row()
         if row is None:
             return
-        if self.current_view == 'students':
-            sid = self.table.item(row, 3).text()
-            rec = dbapi.read_student(sid)
-            if not rec:
-                QMessageBox.warning(self, "Error", "Student not found.")
-                return
-            _, name0, age0, email0 = rec
-            name, ok = QInputDialog.getText(self, "Edit Student Name", "Name:", text=name0)
-            if not ok:
-                return
-            age, ok = QInputDialog.getInt(self, "Edit Student Age", "Age:", value=age0)
-            if not ok:
-                return
-            email, ok = QInputDialog.getText(self, "Edit Student Email", "Email:", text=email0)
-            if not ok:
-                return
-            dbapi.update_student(sid, name=name, age=age, email=email)
-            self.display_students()
-        elif self.current_view == 'instructors':
-            iid = self.table.item(row, 3).text()
-            rec = dbapi.read_instructor(iid)
-            if not rec:
-                QMessageBox.warning(self, "Error", "Instructor not found.")
-                return
-            _, name0, age0, email0 = rec
-            name, ok = QInputDialog.getText(self, "Edit Instructor Name", "Name:", text=name0)
-            if not ok:
-                return
-            age, ok = QInputDialog.getInt(self, "Edit Instructor Age", "Age:", value=age0)
-            if not ok:
-                return
-            email, ok = QInputDialog.getText(self, "Edit Instructor Email", "Email:", text=email0)
-            if not ok:
-                return
-            dbapi.update_instructor(iid, name=name, age=age, email=email)
-            self.display_instructors()
-            self.update_instructor_dropdowns()
-        elif self.current_view == 'courses':
-            cid = self.table.item(row, 0).text()
-            rec = dbapi.read_course(cid)
-            if not rec:
-                QMessageBox.warning(self, "Error", "Course not found.")
-                return
-            _, cname0, _ = rec
-            name, ok = QInputDialog.getText(self, "Edit Course Name", "Course Name:", text=cname0)
-            if not ok:
-                return
-            dbapi.update_course(cid, course_name=name)
-            self.display_courses()
-            self.update_assign_course_dropdown()
-            self.update_course_dropdown()
+        self._edit_handlers[self.current_view](row)
+
+    def _edit_student(self, row):
+        '''
+        Functionality: it lets the user edit the name, the age and the email of the student shown at the given row
+        and updates that row of the table only.
+
+        Parameter: row is the row number in the table model.
+
+        Return Value: None
+        '''
+        _, _, _, sid, courses = self.model.row_at(row)
+        rec = dbapi.read_student(sid)
+        if not rec:
+            QMessageBox.warning(self, "Error", "Student not found.")
+            return
+        _, name0, age0, email0 = rec
+        name, ok = QInputDialog.getText(self, "Edit Student Name", "Name:", text=name0)
+        if not ok:
+            return
+        age, ok = QInputDialog.getInt(self, "Edit Student Age", "Age:", value=age0)
+        if not ok:
+            return
+        email, ok = QInputDialog.getText(self, "Edit Student Email", "Email:", text=email0)
+        if not ok:
+            return
+        dbapi.update_student(sid, name=name, age=age, email=email)
+        # an empty field keeps its old value in the database, so the row is rebuilt from what was stored
+        _, name, age, email = dbapi.read_student(sid)
+        self.model.update_row(row, (name, age, email, sid, courses))
+
+    def _edit_instructor(self, row):
+        '''
+        Functionality: it lets the user edit the name, the age and the email of the instructor shown at the given row
+        and updates that row of the table and the instructor dropdown.
+
+        Parameter: row is the row number in the table model.
+
+        Return Value: None
+        '''
+        iid = self.model.row_at(row)[3]
+        rec = dbapi.read_instructor(iid)
+        if not rec:
+            QMessageBox.warning(self, "Error", "Instructor not found.")
+            return
+        _, name0, age0, email0 = rec
+        name, ok = QInputDialog.getText(self, "Edit Instructor Name", "Name:", text=name0)
+        if not ok:
+            return
+        age, ok = QInputDialog.getInt(self, "Edit Instructor Age", "Age:", value=age0)
+        if not ok:
+            return
+        email, ok = QInputDialog.getText(self, "Edit Instructor Email", "Email:", text=email0)
+        if not ok:
+            return
+        dbapi.update_instructor(iid, name=name, age=age, email=email)
+        # an empty field keeps its old value in the database, so the row is rebuilt from what was stored
+        _, name, age, email = dbapi.read_instructor(iid)
+        self.model.update_row(row, (name, age, email, iid))
+        self.update_instructor_dropdowns()
+
+    def _edit_course(self, row):
+        '''
+        Functionality: it lets the user edit the name of the course shown at the given row
+        and updates that row of the table and the course dropdowns.
+
+        Parameter: row is the row number in the table model.
+
+        Return Value: None
+        '''
+        cid, _, instructor, students = self.model.row_at(row)
+        rec = dbapi.read_course(cid)
+        if not rec:
+            QMessageBox.warning(self, "Error", "Course not found.")
+            return
+        _, cname0, _ = rec
+        name, ok = QInputDialog.getText(self, "Edit Course Name", "Course Name:", text=cname0)
+        if not ok:
+            return
+        dbapi.update_course(cid, course_name=name)
+        # an empty name keeps the old one in the database, so the row shows what was stored
+        name = dbapi.read_course(cid)[1]
+        self.model.update_row(row, (cid, name, instructor, students))
+        self.update_assign_course_dropdown()
+        self.update_course_dropdown()
 
     def delete_selected_record(self):
         '''
@@ -519,55 +967,68 @@ class MainWindow(QMainWindow):
         row = self.get_selected_row()
         if row is None:
             return
-        if self.current_view == 'students':
-            sid = self.table.item(row, 3).text()
-            dbapi.delete_student(sid)
-            self.display_students()
-        elif self.current_view == 'instructors':
-            iid = self.table.item(row, 3).text()
-            dbapi.delete_instructor(iid)
-            self.display_instructors()
-            self.update_instructor_dropdowns()
-            self.display_courses()
-        elif self.current_view == 'courses':
-            cid = self.table.item(row, 0).text()
-            dbapi.delete_course(cid)
-            self.display_courses()
-            self.update_assign_course_dropdown()
-            self.update_course_dropdown()
+        self._delete_handlers[self.current_view](row)
+
+    def _delete_student(self, row):
+        '''
+        Functionality: it deletes the student shown at the given row and removes the row from the table.
+        '''
+        dbapi.delete_student(self.model.row_at(row)[3])
+        self.model.remove_row(row)
+
+    def _delete_instructor(self, row):
+        '''
+        Functionality: it deletes the instructor shown at the given row, removes the row from the table
+        and refreshes the instructor dropdown.
+        '''
+        dbapi.delete_instructor(self.model.row_at(row)[3])
+        self.model.remove_row(row)
+        self.update_instructor_dropdowns()
+
+    def _delete_course(self, row):
+        '''
+        Functionality: it deletes the course shown at the given row, removes the row from the table
+        and refreshes the course dropdowns.
+        '''
+        dbapi.delete_course(self.model.row_at(row)[0])
+        self.model.remove_row(row)
+        self.update_assign_course_dropdown()
+        self.update_course_dropdown()
+
+    def _fill_model(self, headers, sql, rows=None, params=()):
+        '''
+        Functionality: it loads a view into the table model with the table repaints held back,
+        so the view paints once when the new rows are in instead of once per model change.
+        the rows are never resized to their contents, the table keeps its default row height.
+
+        Parameter: this function has 4 parameters
+        1. headers: the list of column headers.
+        2. sql: the query read page by page when rows is None.
+        3. rows: the rows to show in column order, or None to read them from the DB.
+        4. params: the parameters of the query.
+
+        Return Value: None
+        '''
+        self.table.setUpdatesEnabled(False)
+        try:
+            if rows is None:
+                self.model.set_query(self._view_con, headers, sql, params)
+            else:
+                self.model.set_rows(headers, rows)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def display_students(self, students=None):
         '''
         Functionality: it renders the students view in the table.
 
         Parameter: students is the only parameter for this function, the user can either enter a list of tupple if he has the information of the students
-        or can enter nothing and the data will be read from the DB.
+        (name, age, email, student_id, registered courses) or can enter nothing and the data will be read from the DB page by page.
 
         Return Value: None
         '''
-        self.table.clear()
         headers = ["Name", "Age", "Email", "Student ID", "Registered Courses"]
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
-        with sqlite3.connect("database.db") as con:
-            cur = con.cursor()
-            if students is None:
-                cur.execute("SELECT student_id, name, age, email FROM students ORDER BY name")
-                rows = cur.fetchall()
-            else:
-                rows = students
-            self.table.setRowCount(len(rows))
-            for r, (sid, name, age, email) in enumerate(rows):
-                cur.execute(
-                    "SELECT c.course_name FROM registrations r JOIN courses c ON c.course_id=r.course_id WHERE r.student_id=? ORDER BY c.course_name",
-                    (sid,),
-                )
-                courses = ", ".join([x[0] for x in cur.fetchall()])
-                self.table.setItem(r, 0, QTableWidgetItem(name))
-                self.table.setItem(r, 1, QTableWidgetItem(str(age)))
-                self.table.setItem(r, 2, QTableWidgetItem(email))
-                self.table.setItem(r, 3, QTableWidgetItem(sid))
-                self.table.setItem(r, 4, QTableWidgetItem(courses))
+        self._fill_model(headers, STUDENTS_WITH_COURSES_SQL + " ORDER BY s.name, s.student_id", students)
         self.current_view = 'students'
 
     def display_instructors(self, instructors=None):
@@ -575,112 +1036,48 @@ class MainWindow(QMainWindow):
         Functionality: it renders the instructors view in the table.
 
         Parameter: instructors is the only parameter for this function, the user can either enter a list of tupple if he has the information of the instructors
-        or can enter nothing and the data will be read from the DB.
+        (instructor_id, name, age, email) or can enter nothing and the data will be read from the DB page by page.
 
         Return Value: None
         '''
-         
-        self.table.clear()
+
         headers = ["Name", "Age", "Email", "Instructor ID"]
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
-        rows = instructors if instructors is not None else dbapi.list_instructors()
-        self.table.setRowCount(len(rows))
-        for r, (iid, name, age, email) in enumerate(rows):
-            self.table.setItem(r, 0, QTableWidgetItem(name))
-            self.table.setItem(r, 1, QTableWidgetItem(str(age)))
-            self.table.setItem(r, 2, QTableWidgetItem(email))
-            self.table.setItem(r, 3, QTableWidgetItem(iid))
+        if instructors is not None:
+            instructors = [(name, age, email, iid) for iid, name, age, email in instructors]
+        self._fill_model(headers, "SELECT name, age, email, instructor_id FROM instructors ORDER BY name, instructor_id", instructors)
         self.current_view = 'instructors'
 
     def display_courses(self, courses=None):
         '''
         Functionality: it renders the courses view in the table.
 
-        Parameter: courses is the only parameter for this function, the user can either enter a list of tupple if he has the courses.
-        or can enter nothing and the data will be read from the DB.
+        Parameter: courses is the only parameter for this function, the user can either enter a list of tupple if he has the courses
+        (course_id, course_name, instructor name, enrolled students) or can enter nothing and the data will be read from the DB page by page.
 
         Return Value: None
         '''
-        self.table.clear()
         headers = ["Course ID", "Course Name", "Instructor", "Enrolled Students"]
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
-        if courses is None:
-            rows = dbapi.list_courses()
-        else:
-            rows = courses
-        with sqlite3.connect("database.db") as con:
-            cur = con.cursor()
-            self.table.setRowCount(len(rows))
-            for r, (cid, cname, iname) in enumerate(rows):
-                cur.execute(
-                    "SELECT s.name FROM registrations r JOIN students s ON s.student_id=r.student_id WHERE r.course_id=? ORDER BY s.name",
-                    (cid,),
-                )
-                students = ", ".join([x[0] for x in cur.fetchall()])
-                self.table.setItem(r, 0, QTableWidgetItem(cid))
-                self.table.setItem(r, 1, QTableWidgetItem(cname))
-                self.table.setItem(r, 2, QTableWidgetItem(iname))
-                self.table.setItem(r, 3, QTableWidgetItem(students))
+        self._fill_model(headers, COURSES_WITH_STUDENTS_SQL + " ORDER BY c.course_name, c.course_id", courses)
         self.current_view = 'courses'
 
     def search_records(self):
         '''
-        Functionality: this function will search the current view based on what the user has typed.
+        Functionality: this function will filter the current view based on what the user has typed.
+        the search goes through the FTS5 search tables, every word typed is matched as the start of a word
+        in the names, ids and emails (students also match on their courses and courses on their instructor),
+        and the matching rows are read page by page like the full view.
+        an empty search box shows all the rows again.
 
         Parameter: None
         
         Return Value: None
         '''
-        q = self.search_input.text().strip().lower()
-        if not q:
-            if self.current_view == 'students':
-                self.display_students()
-            elif self.current_view == 'instructors':
-                self.display_instructors()
-            else:
-                self.display_courses()
+        self._search_timer.stop()
+        text = self.search_input.text().strip()
+        if not text:
+            {'students': self.display_students, 'instructors': self.display_instructors, 'courses': self.display_courses}[self.current_view]()
             return
-        with sqlite3.connect("database.db") as con:
-            cur = con.cursor()
-            if self.current_view == 'students':
-                like = f"%{q}%"
-                cur.execute("""
-                    SELECT s.student_id, s.name, s.age, s.email
-                    FROM students s
-                    LEFT JOIN registrations r ON r.student_id=s.student_id
-                    LEFT JOIN courses c ON c.course_id=r.course_id
-                    WHERE lower(s.name) LIKE ? OR lower(s.student_id) LIKE ? OR lower(c.course_name) LIKE ?
-                    GROUP BY s.student_id
-                    ORDER BY s.name
-                """, (like, like, like))
-                rows = cur.fetchall()
-                self.display_students(rows)
-            elif self.current_view == 'instructors':
-                like = f"%{q}%"
-                cur.execute("""
-                    SELECT instructor_id, name, age, email
-                    FROM instructors
-                    WHERE lower(name) LIKE ? OR lower(instructor_id) LIKE ? OR lower(email) LIKE ?
-                    ORDER BY name
-                """, (like, like, like))
-                rows = cur.fetchall()
-                self.display_instructors(rows)
-            elif self.current_view == 'courses':
-                like = f"%{q}%"
-                cur.execute("""
-                    SELECT c.course_id, c.course_name, COALESCE(i.name,'')
-                    FROM courses c
-                    LEFT JOIN instructors i ON i.instructor_id=c.instructor_id
-                    LEFT JOIN registrations r ON r.course_id=c.course_id
-                    LEFT JOIN students s ON s.student_id=r.student_id
-                    WHERE lower(c.course_name) LIKE ? OR lower(c.course_id) LIKE ? OR lower(i.name) LIKE ? OR lower(s.name) LIKE ?
-                    GROUP BY c.course_id
-                    ORDER BY c.course_name
-                """, (like, like, like, like))
-                rows = cur.fetchall()
-                self.display_courses(rows)
+        self._fill_model(self.model.headers(), SEARCH_SQL[self.current_view], params=(dbapi.fts_query(text),))
 
     def update_instructor_dropdowns(self):
         '''
@@ -690,9 +1087,8 @@ class MainWindow(QMainWindow):
 
         Returns: None
         '''
-        self.assign_instructor_dropdown.clear()
-        for iid, name, _, _ in dbapi.list_instructors():
-            self.assign_instructor_dropdown.addItem(f"{name} ({iid})", iid)
+        instructors = dbapi.list_instructors()
+        self._fill_dropdown(self.assign_instructor_dropdown, [f"{name} ({iid})" for iid, name, _, _ in instructors], [iid for iid, _, _, _ in instructors])
 
     def update_assign_course_dropdown(self):
         '''
@@ -702,9 +1098,8 @@ class MainWindow(QMainWindow):
 
         Return Value: None
         '''
-        self.assign_course_dropdown.clear()
-        for cid, cname, _ in dbapi.list_courses():
-            self.assign_course_dropdown.addItem(f"{cname} ({cid})", cid)
+        courses = dbapi.list_courses()
+        self._fill_dropdown(self.assign_course_dropdown, [f"{cname} ({cid})" for cid, cname, _ in courses], [cid for cid, _, _ in courses])
 
     def assign_instructor_to_course(self):
         '''
@@ -744,7 +1139,6 @@ class MainWindow(QMainWindow):
 
         User Feedback: the function will send a message box to the user telling them if it was a success or if there has been an error.
         '''
-        import re
         name = self.student_name.text().strip()
         age = self.student_age.text().strip()
         email = self.student_email.text().strip()
@@ -752,16 +1146,19 @@ class MainWindow(QMainWindow):
         if not name or not age or not email or not student_id:
             QMessageBox.warning(self, "Input Error", "All fields are required.")
             return
-        if not age.isdigit() or int(age) < 0:
+        try:
+            age_i = int(age)
+        except ValueError:
+            age_i = -1
+        if age_i < 0:
             QMessageBox.warning(self, "Input Error", "Age must be a non-negative integer.")
             return
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+        if not _EMAIL_RE.fullmatch(email):
             QMessageBox.warning(self, "Input Error", "Invalid email format.")
             return
-        if dbapi.read_student(student_id):
+        if not dbapi.try_create_student(student_id, name, age_i, email):
             QMessageBox.warning(self, "Input Error", "Student ID already exists.")
             return
-        dbapi.create_student(student_id, name, int(age), email)
         QMessageBox.information(self, "Student Added", f"Student: {name}, Age: {age}, Email: {email}, ID: {student_id}")
         if self.current_view == 'students':
             self.display_students()
@@ -777,7 +1174,6 @@ class MainWindow(QMainWindow):
 
         User Feedback: the function will send a message box to the user telling them if it was a success or if there has been an error.
         '''
-        import re
         name = self.instructor_name.text().strip()
         age = self.instructor_age.text().strip()
         email = self.instructor_email.text().strip()
@@ -785,18 +1181,22 @@ class MainWindow(QMainWindow):
         if not name or not age or not email or not instructor_id:
             QMessageBox.warning(self, "Input Error", "All fields are required.")
             return
-        if not age.isdigit() or int(age) < 0:
+        try:
+            age_i = int(age)
+        except ValueError:
+            age_i = -1
+        if age_i < 0:
             QMessageBox.warning(self, "Input Error", "Age must be a non-negative integer.")
             return
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+        if not _EMAIL_RE.fullmatch(email):
             QMessageBox.warning(self, "Input Error", "Invalid email format.")
             return
-        if dbapi.read_instructor(instructor_id):
+        if not dbapi.try_create_instructor(instructor_id, name, age_i, email):
             QMessageBox.warning(self, "Input Error", "Instructor ID already exists.")
             return
-        dbapi.create_instructor(instructor_id, name, int(age), email)
         QMessageBox.information(self, "Instructor Added", f"Instructor: {name}, Age: {age}, Email: {email}, ID: {instructor_id}")
-        self.update_instructor_dropdowns()
+        if not self._add_to_dropdowns(dbapi.list_instructors(), instructor_id, [self.assign_instructor_dropdown]):
+            self.update_instructor_dropdowns()
         if self.current_view == 'instructors':
             self.display_instructors()
 
@@ -817,16 +1217,17 @@ class MainWindow(QMainWindow):
         if not course_id or not course_name or not instructor_id:
             QMessageBox.warning(self, "Input Error", "All fields are required.")
             return
-        if dbapi.read_course(course_id):
-            QMessageBox.warning(self, "Input Error", "Course ID already exists.")
-            return
-        if not dbapi.read_instructor(instructor_id):
+        instructor = dbapi.read_instructor(instructor_id)
+        if not instructor:
             QMessageBox.warning(self, "Input Error", "Instructor ID not found!")
             return
-        dbapi.create_course(course_id, course_name, instructor_id)
+        if not dbapi.try_create_course(course_id, course_name, instructor_id):
+            QMessageBox.warning(self, "Input Error", "Course ID already exists.")
+            return
         QMessageBox.information(self, "Course Added", f"Course: {course_name}, ID: {course_id}")
-        self.update_course_dropdown()
-        self.update_assign_course_dropdown()
+        if not self._add_to_dropdowns(dbapi.list_courses(), course_id, [self.reg_course_dropdown, self.assign_course_dropdown]):
+            self.update_course_dropdown()
+            self.update_assign_course_dropdown()
         if self.current_view == 'courses':
             self.display_courses()
 
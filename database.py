@@ -1,7 +1,158 @@
 import sqlite3
 import os
+import queue
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 
+# One connection shared by every function of this module instead of opening the file on each call.
+# Writes run inside `with _CONN:` so they commit together, or roll back if a statement fails.
+# The statement cache (looked up by SQL text) is sized to hold every query of the module once prepared.
+_CONN = sqlite3.connect('database.db', check_same_thread=False, cached_statements=256)
+# These settings belong to the connection, not the file, so they are applied once here rather than by create_table:
+# synchronous=NORMAL drops the fsync of every commit (safe under WAL), and the connection gets a 20 MB page cache,
+# in-memory temp tables and a memory mapped file.
+_CONN.execute("PRAGMA synchronous=NORMAL")
+_CONN.execute("PRAGMA cache_size=-20000")
+_CONN.execute("PRAGMA temp_store=MEMORY")
+_CONN.execute("PRAGMA mmap_size=268435456")
+
+
+class _Pool:
+    '''
+    Functionality: this class keeps a few already opened connections for code running outside the thread that uses
+    _CONN (the export jobs of the GUI), so such a job reuses a connection with a warm page cache instead of opening one.
+    the last returned connection is handed out first, and a connection idle for longer than max_idle seconds is closed.
+
+    Attributes:
+    1. _path of type string: the database file the connections open.
+    2. _max_idle of type float: seconds a connection may wait in the pool before it is dropped.
+    3. _idle of type LifoQueue: the (connection, returned at) pairs waiting to be borrowed, at most max_size of them.
+    '''
+    def __init__(self, path, max_size=4, max_idle=300.0):
+        '''
+        Functionality: it creates an empty pool, connections are only opened when they are first borrowed.
+        '''
+        self._path = path
+        self._max_idle = max_idle
+        self._idle = queue.LifoQueue(max_size)
+
+    def _connect(self):
+        '''
+        Functionality: it opens a new connection to the pool's file with the same cache settings as _CONN.
+        '''
+        con = sqlite3.connect(self._path, check_same_thread=False, cached_statements=256)
+        con.execute("PRAGMA cache_size=-20000")
+        con.execute("PRAGMA mmap_size=268435456")
+        return con
+
+    @contextmanager
+    def borrow(self):
+        '''
+        Functionality: it yields a pooled connection, or a new one when none is idle, and puts it back afterwards.
+        a connection whose block raised is closed instead of being put back, and an open transaction is rolled back.
+        '''
+        con = None
+        while con is None:
+            try:
+                con, returned_at = self._idle.get_nowait()
+            except queue.Empty:
+                con = self._connect()
+                break
+            if time.monotonic() - returned_at > self._max_idle:
+                con.close()
+                con = None
+        try:
+            yield con
+        except BaseException:
+            con.close()
+            raise
+        if con.in_transaction:
+            con.rollback()
+        try:
+            self._idle.put_nowait((con, time.monotonic()))
+        except queue.Full:
+            con.close()
+
+
+_POOL = _Pool('database.db')
+
+# Columns of each table indexed in its FTS5 search table (<table>_fts), kept in sync by triggers.
+FTS_COLUMNS = {
+    'students': ('student_id', 'name', 'email'),
+    'instructors': ('instructor_id', 'name', 'email'),
+    'courses': ('course_id', 'course_name'),
+}
+
+# Set by create_table once the schema is in place, so calling it again from another entry point is a no-op.
+_initialized = False
+
+# Rows returned by list_students/list_instructors/list_courses, keyed by table and kept until a write to a
+# table the list reads drops them (invalidate_lists), so repeated refreshes don't re-run the query and sort.
+_LIST_CACHE = {}
+
+# Queries behind those lists, also run on pooled connections by fetch_list.
+_LIST_SQL = {
+    'students': "SELECT student_id, name, age, email FROM students ORDER BY name",
+    'instructors': "SELECT instructor_id, name, age, email FROM instructors ORDER BY name",
+    # Join courses with instructors to display instructor names
+    'courses': """
+        SELECT c.course_id, c.course_name, COALESCE(i.name, '')
+        FROM courses c
+        LEFT JOIN instructors i ON i.instructor_id = c.instructor_id
+        ORDER BY c.course_name
+    """,
+}
+
+# Rows found by read_student/read_instructor/read_course, keyed by table then by ID, in least recently used order.
+# Only rows that exist are kept, so an insert never makes an entry stale; updates and deletes drop theirs (_forget_rows).
+_ROW_CACHE = {'students': OrderedDict(), 'instructors': OrderedDict(), 'courses': OrderedDict()}
+_ROW_CACHE_SIZE = 1024
+
+# Tables whose foreign keys carry an ON DELETE action, written with a {name} placeholder so the same
+# definition creates the table and rebuilds it when an older database still has the plain foreign keys.
+_COURSES_DDL = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        course_id TEXT PRIMARY KEY,
+        course_name TEXT NOT NULL,
+        instructor_id TEXT,
+        FOREIGN KEY (instructor_id) REFERENCES instructors(instructor_id) ON DELETE SET NULL
+    )
+    """
+_REGISTRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        registration_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id TEXT,
+        course_id TEXT,
+        FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE,
+        FOREIGN KEY (course_id) REFERENCES courses(course_id) ON DELETE CASCADE
+    )
+    """
+
+
+def _migrate_foreign_keys(cursor):
+    '''
+    Functionality: databases created before the ON DELETE actions were added keep their old foreign keys, since
+    CREATE TABLE IF NOT EXISTS doesn't touch an existing table. this function rebuilds courses and registrations
+    with the current definition when their foreign keys have no ON DELETE action, keeping every row and rowid.
+    it must run while the foreign keys are off, the old tables are dropped before the new ones are renamed.
+    Parameter: cursor is a cursor of the shared connection
+    Return value: None
+    '''
+    for table, ddl, columns in (
+        ('courses', _COURSES_DDL, 'course_id, course_name, instructor_id'),
+        ('registrations', _REGISTRATIONS_DDL, 'registration_id, student_id, course_id'),
+    ):
+        actions = {row[6] for row in cursor.execute(f"PRAGMA foreign_key_list({table})")}
+        if actions <= {'CASCADE', 'SET NULL'}:
+            continue
+        with _CONN:
+            cursor.execute(ddl.format(name=f"{table}_new"))
+            cursor.execute(f"INSERT INTO {table}_new (rowid, {columns}) SELECT rowid, {columns} FROM {table}")
+            cursor.execute(f"DROP TABLE {table}")
+            cursor.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
 
 def create_table():
 
@@ -10,14 +161,25 @@ def create_table():
     For the create_table function, we are creating 4 different tables in the database and it defines the primary key, foreign key and constraints of the attributes in each table:
     1. students table which has 4 columns: student id which is unique to each student, name, age(the check means that its only accepted if the age is positive ) and the email
     2. instructors table has also 4 columns: instructor id that is unique, name, age with the condition and email 
-    3. courses table has 3 columns: course_id that is unique, course_name, instructor id which links the course to an id.
-    4. registration table has 3 columns: registration_id which is unique, student id and course_id
+    3. courses table has 3 columns: course_id that is unique, course_name, instructor id which links the course to an id (set to NULL when the instructor is deleted).
+    4. registration table has 3 columns: registration_id which is unique, student id and course_id (deleted with their student or course)
+    before creating the tables it switches the database to the WAL journal, and it turns the foreign keys on at the end.
+    it also creates an FTS5 search table per table (students_fts, instructors_fts, courses_fts) with triggers that keep it in sync.
+    it also creates indexes on registrations(student_id, course_id), registrations(course_id) and courses(instructor_id) so the joins
+    between the tables are B-tree lookups instead of full table scans, the first one is unique so a student can't be registered twice in a course.
+    the planner statistics (ANALYZE) are gathered the first time, when the database has none yet.
+
+    the database is set up only by the first call, the later calls return right away. the GUIs call it at startup.
 
     Parameter: this function doesn't has any parameter
     return values: the function doesn't return anything. 
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
+    global _initialized
+    if _initialized:
+        return
+    cursor = _CONN.cursor()
+    # WAL lets readers run while a write commits, the journal mode is stored in the database file
+    cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS students (
         student_id TEXT PRIMARY KEY,
@@ -34,25 +196,123 @@ def create_table():
         email TEXT NOT NULL
     )
     """)
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS courses (
-        course_id TEXT PRIMARY KEY,
-        course_name TEXT NOT NULL,
-        instructor_id TEXT,
-        FOREIGN KEY (instructor_id) REFERENCES instructors(instructor_id)
-    )
-    """)
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS registrations (
-        registration_id INTEGER PRIMARY KEY AUTOINCREMENT,
-        student_id TEXT,
-        course_id TEXT,
-        FOREIGN KEY (student_id) REFERENCES students(student_id),
-        FOREIGN KEY (course_id) REFERENCES courses(course_id)
-    )
-    """)
-    db.commit()
-    db.close()
+    cursor.execute(_COURSES_DDL.format(name='courses'))
+    cursor.execute(_REGISTRATIONS_DDL.format(name='registrations'))
+    _migrate_foreign_keys(cursor)
+    if not cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_reg_student_course'").fetchone():
+        # a student is registered once per course, the duplicates an older database may hold are dropped first
+        cursor.execute(
+            "DELETE FROM registrations WHERE rowid NOT IN "
+            "(SELECT MIN(rowid) FROM registrations GROUP BY student_id, course_id)"
+        )
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_reg_student_course ON registrations(student_id, course_id)")
+    # the unique index starts with student_id, so it also serves the lookups by student
+    cursor.execute("DROP INDEX IF EXISTS idx_reg_student")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reg_course ON registrations(course_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_courses_instructor ON courses(instructor_id)")
+    for table, columns in FTS_COLUMNS.items():
+        fts = f"{table}_fts"
+        cols = ", ".join(columns)
+        new_cols = ", ".join(f"new.{c}" for c in columns)
+        old_cols = ", ".join(f"old.{c}" for c in columns)
+        exists = cursor.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (fts,)).fetchone()
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table}', content_rowid='rowid', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts} (rowid, {cols}) VALUES (new.rowid, {new_cols});
+        END
+        """)
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_cols});
+        END
+        """)
+        cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE ON {table} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_cols});
+            INSERT INTO {fts} (rowid, {cols}) VALUES (new.rowid, {new_cols});
+        END
+        """)
+        if not exists:
+            # index the rows that were there before the search table existed
+            cursor.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+    if not cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone():
+        # planner statistics are gathered once, so the registration and course indexes get picked for the joins
+        cursor.execute("ANALYZE")
+    _CONN.commit()
+    # the ON DELETE actions only run with the foreign keys on, which can't be switched inside a transaction
+    cursor.execute("PRAGMA foreign_keys=ON")
+    _initialized = True
+
+def borrow():
+    '''
+    Functionality: this function lends a connection of the module pool, for work that runs on another thread than the
+    functions of this module, it is used as `with borrow() as con:` and the connection goes back to the pool after the block.
+    Parameters: None
+    Return value: a context manager yielding a sqlite3 connection
+    '''
+    return _POOL.borrow()
+
+def fts_query(text):
+    '''
+    Functionality: this function turns the text typed in a search box into an FTS5 MATCH query.
+    every word is quoted so punctuation can't break the query syntax, and matched as a prefix so the results show up while typing.
+    Parameter: text is the search text
+    Return value: the MATCH query string, e.g. 'lan omar' gives '"lan"* "omar"*'
+    '''
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in text.split())
+
+def invalidate_lists(*tables):
+    '''
+    Functionality: this function drops the cached list_* rows that read one of the given tables, it is called by every
+    function of this module that writes to students, instructors or courses and by code writing to the database directly.
+    Parameters: tables are the names of the tables that were written, with no name every cached list is dropped.
+    Return value: None
+    '''
+    if not tables:
+        _LIST_CACHE.clear()
+        return
+    for table in tables:
+        _LIST_CACHE.pop(table, None)
+        # the courses list shows the instructor names
+        if table == 'instructors':
+            _LIST_CACHE.pop('courses', None)
+
+def _cached_row(table, key, sql):
+    '''
+    Functionality: this function returns the row of the given table with this ID from the row cache, and runs sql
+    on a miss. a found row is cached and the least recently used row is dropped once the table holds _ROW_CACHE_SIZE rows.
+    the rows are tuples, so a caller can't change the cached copy.
+    the IDs are text columns, so the key is turned into a string: 123 and '123' are the same row and the same cache entry.
+    Parameters: table is the table name, key is the ID and sql is the SELECT with one placeholder for the ID
+    Return value: the row tuple, or None if there is no row with this ID
+    '''
+    key = str(key)
+    rows = _ROW_CACHE[table]
+    row = rows.get(key)
+    if row is not None:
+        rows.move_to_end(key)
+        return row
+    row = _CONN.execute(sql, (key,)).fetchone()
+    if row is not None:
+        rows[key] = row
+        if len(rows) > _ROW_CACHE_SIZE:
+            rows.popitem(last=False)
+    return row
+
+def _forget_rows(table, key=None):
+    '''
+    Functionality: this function drops the cached row of the given ID, or every cached row of the table when no ID is given.
+    Parameters: table is the table name and key is the ID of the row that changed
+    Return value: None
+    '''
+    if key is None:
+        _ROW_CACHE[table].clear()
+    else:
+        _ROW_CACHE[table].pop(str(key), None)
 
 def create_student(student_id, name, age, email):
 
@@ -65,14 +325,60 @@ def create_student(student_id, name, age, email):
         4.Email: the email of the sudent 
     Return value: this function doesn't have a return value it only adds the student to the database table.
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-    cursor.execute("INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?)",(student_id, name, age, email))
-    db.commit()
-    db.close()
+    with _CONN:
+        cursor = _CONN.cursor()
+        cursor.execute("INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?)",(student_id, name, age, email))
+    invalidate_lists('students')
+
+def try_create_student(student_id, name, age, email):
+    '''
+    Functionality: this function inserts a new student unless the student_id is already taken, the duplicate check and the insert are one statement
+    Parameters: the same 4 parameters as create_student
+    Return value: True if the student was added, False if a student with this student_id already exists
+    '''
+    with _CONN:
+        cursor = _CONN.cursor()
+        cursor.execute(
+            "INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(student_id) DO NOTHING RETURNING student_id",
+            (student_id, name, age, email),
+        )
+        added = cursor.fetchone() is not None
+    if added:
+        invalidate_lists('students')
+    return added
 
 
 
+def bulk_create_students(rows):
+    '''
+    Functionality: this function inserts many students into the students table at once, all the rows are inserted
+    by one executemany in a single transaction so the commit is paid once instead of once per student.
+    if one of the rows is rejected (for example a student_id that already exists) none of the rows are added.
+    Parameters: rows is an iterable of (student_id, name, age, email) tuples, in the same order as create_student
+    Return value: None
+    '''
+    with _CONN:
+        _CONN.executemany("INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?)", rows)
+    invalidate_lists('students')
+
+def upsert_students_bulk(rows):
+    '''
+    Functionality: this function inserts many students at once like bulk_create_students, but a student whose student_id
+    already exists gets the name, age and email of the row instead, so the same rows can be imported again.
+    the check and the insert or update are one statement run by executemany in a single transaction.
+    Parameters: rows is an iterable of (student_id, name, age, email) tuples
+    Return value: None
+    '''
+    with _CONN:
+        _CONN.executemany(
+            "INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(student_id) DO UPDATE SET name = excluded.name, age = excluded.age, email = excluded.email",
+            rows,
+        )
+    _forget_rows('students')
+    invalidate_lists('students')
+
 def read_student(student_id):
     '''
     Functionality: This function retrieve the records of a student based on the provided student_id
@@ -80,12 +386,7 @@ def read_student(student_id):
     Return value: in this function there is 2 case of return value, if the student id provided exist in the table then the function will return a tupple with the information of the student
     if the student_id provided does not exist then the function will return None
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-    cursor.execute("SELECT * FROM students WHERE student_id = ?", (student_id,))
-    result = cursor.fetchone()
-    db.close()
-    return result
+    return _cached_row('students', student_id, "SELECT * FROM students WHERE student_id = ?")
 
 def update_student(student_id, name=None, age=None, email=None):
     '''
@@ -96,31 +397,33 @@ def update_student(student_id, name=None, age=None, email=None):
     3. age: also optional, either we can add a new age or the default value will be None
     4. email: also optional, either we can add a new name or the default would be optional
     Return value: the function doesn't return any value. 
+    the fields that are given are changed together in one UPDATE, and nothing is executed when no field is given.
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-    if name:
-        cursor.execute("UPDATE students SET name = ? WHERE student_id = ?", (name, student_id))
-    if age is not None:
-        cursor.execute("UPDATE students SET age = ? WHERE student_id = ?", (age, student_id))
-    if email:
-        cursor.execute("UPDATE students SET email = ? WHERE student_id = ?", (email, student_id))
-    db.commit()
-    db.close()
+    name = name or None
+    email = email or None
+    if name is None and age is None and email is None:
+        return
+    with _CONN:
+        _CONN.execute(
+            "UPDATE students SET name = COALESCE(?, name), age = COALESCE(?, age), email = COALESCE(?, email) "
+            "WHERE student_id = ?",
+            (name, age, email, student_id),
+        )
+    _forget_rows('students', student_id)
+    invalidate_lists('students')
 
 def delete_student(student_id):
     ''' 
     Functionality: This function delete a student and the registrations related to this student based on his student_id.
-    This function first start by deleting any record in the registration table where the student_id that we want to delete is present and then it will delete the student from the students table.
+    the registrations of the student are removed by the ON DELETE CASCADE of the registrations table.
     Parameter: this function has only one parameter which is the student_id, we enter the student_id of the student that we want to delete
     Return value: this function doesn't return anything, it returns None
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-    cursor.execute("DELETE FROM registrations WHERE student_id = ?", (student_id,))
-    cursor.execute("DELETE FROM students WHERE student_id = ?", (student_id,))
-    db.commit()
-    db.close()
+    with _CONN:
+        cursor = _CONN.cursor()
+        cursor.execute("DELETE FROM students WHERE student_id = ?", (student_id,))
+    _forget_rows('students', student_id)
+    invalidate_lists('students')
 
 def create_instructor(instructor_id, name, age, email):
     '''
@@ -132,11 +435,55 @@ def create_instructor(instructor_id, name, age, email):
         4.Email: the email of the instructor  
     Return value: it return None, it only adds the instructor to the database table.
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-    cursor.execute("INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?)",(instructor_id, name, age, email))
-    db.commit()
-    db.close()
+    with _CONN:
+        cursor = _CONN.cursor()
+        cursor.execute("INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?)",(instructor_id, name, age, email))
+    invalidate_lists('instructors')
+
+def try_create_instructor(instructor_id, name, age, email):
+    '''
+    Functionality: this function inserts a new instructor unless the instructor_id is already taken, the duplicate check and the insert are one statement
+    Parameters: the same 4 parameters as create_instructor
+    Return value: True if the instructor was added, False if an instructor with this instructor_id already exists
+    '''
+    with _CONN:
+        cursor = _CONN.cursor()
+        cursor.execute(
+            "INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(instructor_id) DO NOTHING RETURNING instructor_id",
+            (instructor_id, name, age, email),
+        )
+        added = cursor.fetchone() is not None
+    if added:
+        invalidate_lists('instructors')
+    return added
+
+def bulk_create_instructors(rows):
+    '''
+    Functionality: this function inserts many instructors into the instructors table at once with one executemany
+    in a single transaction, if one of the rows is rejected none of the rows are added.
+    Parameters: rows is an iterable of (instructor_id, name, age, email) tuples, in the same order as create_instructor
+    Return value: None
+    '''
+    with _CONN:
+        _CONN.executemany("INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?)", rows)
+    invalidate_lists('instructors')
+
+def upsert_instructors_bulk(rows):
+    '''
+    Functionality: this function inserts many instructors at once, an instructor whose instructor_id already exists
+    gets the name, age and email of the row instead. it is one executemany in a single transaction.
+    Parameters: rows is an iterable of (instructor_id, name, age, email) tuples
+    Return value: None
+    '''
+    with _CONN:
+        _CONN.executemany(
+            "INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(instructor_id) DO UPDATE SET name = excluded.name, age = excluded.age, email = excluded.email",
+            rows,
+        )
+    _forget_rows('instructors')
+    invalidate_lists('instructors')
 
 def read_instructor(instructor_id):
 
@@ -146,12 +493,7 @@ def read_instructor(instructor_id):
     Return value: in this function there is 2 case of return value, if the instructor_id provided exist in the table then the function will return a tupple with the information of the instructor
     if the instructor_id provided does not exist then the function will return None
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-    cursor.execute("SELECT * FROM instructors WHERE instructor_id = ?", (instructor_id,))
-    result = cursor.fetchone()
-    db.close()
-    return result
+    return _cached_row('instructors', instructor_id, "SELECT * FROM instructors WHERE instructor_id = ?")
 
 def update_instructor(instructor_id, name=None, age=None, email=None):
 
@@ -163,33 +505,36 @@ def update_instructor(instructor_id, name=None, age=None, email=None):
     3. age: also optional, either we can add a new age or the default value will be None
     4. email: also optional, either we can add a new name or the default would be optional
     Return value: the function will return None. 
+    the fields that are given are changed together in one UPDATE, and nothing is executed when no field is given.
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-    if name:
-        cursor.execute("UPDATE instructors SET name = ? WHERE instructor_id = ?", (name, instructor_id))
-    if age is not None:
-        cursor.execute("UPDATE instructors SET age = ? WHERE instructor_id = ?", (age, instructor_id))
-    if email:
-        cursor.execute("UPDATE instructors SET email = ? WHERE instructor_id = ?", (email, instructor_id))
-    db.commit()
-    db.close()
+    name = name or None
+    email = email or None
+    if name is None and age is None and email is None:
+        return
+    with _CONN:
+        _CONN.execute(
+            "UPDATE instructors SET name = COALESCE(?, name), age = COALESCE(?, age), email = COALESCE(?, email) "
+            "WHERE instructor_id = ?",
+            (name, age, email, instructor_id),
+        )
+    _forget_rows('instructors', instructor_id)
+    invalidate_lists('instructors')
 
 def delete_instructor(instructor_id):
 
     '''
     Functionality: this function deletes an instructor and unassigns them from the courses based on the instructor_id of the instructor that we want to delete
-    this function first start by unassigning the instructor to do that it will go to the courses table and replace the instructor_id of the instructor that we want to delete by NULL
-    and then it will go in the instructor table and delete the instructor based on the provided id. 
+    the ON DELETE SET NULL of the courses table replaces the instructor_id of their courses by NULL when the instructor is deleted.
     Parameters: it only has one parameter which is the instructor_id of the instructor that we want to delete.
     Return value: it will return None.
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-    cursor.execute("UPDATE courses SET instructor_id = NULL WHERE instructor_id = ?", (instructor_id,))
-    cursor.execute("DELETE FROM instructors WHERE instructor_id = ?", (instructor_id,))
-    db.commit()
-    db.close()
+    with _CONN:
+        cursor = _CONN.cursor()
+        cursor.execute("DELETE FROM instructors WHERE instructor_id = ?", (instructor_id,))
+    _forget_rows('instructors', instructor_id)
+    # ON DELETE SET NULL changed the instructor_id of their courses
+    _forget_rows('courses')
+    invalidate_lists('instructors')
 
 def create_course(course_id: str, course_name: str, instructor_id: str = None) -> None:
     """
@@ -203,19 +548,85 @@ def create_course(course_id: str, course_name: str, instructor_id: str = None) -
     Returns:
         None
     """
-    # Connect to the database
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
+    # The transaction commits when the block ends
+    with _CONN:
+        cursor = _CONN.cursor()
 
-    # Insert a new course row into the "courses" table
-    cursor.execute(
-        "INSERT INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?)",
-        (course_id, course_name, instructor_id)
-    )
+        # Insert a new course row into the "courses" table
+        cursor.execute(
+            "INSERT INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?)",
+            (course_id, course_name, instructor_id)
+        )
+    invalidate_lists('courses')
 
-    # Save changes and close connection
-    db.commit()
-    db.close()
+
+def try_create_course(course_id: str, course_name: str, instructor_id: str = None) -> bool:
+    """
+    Create a new course record unless the course ID is already taken.
+
+    Parameters:
+        course_id (str): Unique identifier for the course.
+        course_name (str): The name/title of the course.
+        instructor_id (str, optional): The ID of the instructor teaching the course. Defaults to None.
+
+    Returns:
+        bool: True if the course was added, False if a course with this ID already exists.
+    """
+    with _CONN:
+        cursor = _CONN.cursor()
+
+        # The duplicate check and the insert are a single statement
+        cursor.execute(
+            "INSERT INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?) "
+            "ON CONFLICT(course_id) DO NOTHING RETURNING course_id",
+            (course_id, course_name, instructor_id)
+        )
+        added = cursor.fetchone() is not None
+    if added:
+        invalidate_lists('courses')
+    return added
+
+
+def bulk_create_courses(rows) -> None:
+    """
+    Create many course records in a single transaction.
+
+    Parameters:
+        rows (Iterable[tuple]): (course_id, course_name, instructor_id) tuples, instructor_id may be None.
+
+    Returns:
+        None
+    """
+    # One executemany and one commit for all rows; a rejected row rolls back the whole batch
+    with _CONN:
+        _CONN.executemany(
+            "INSERT INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?)",
+            rows
+        )
+    invalidate_lists('courses')
+
+
+def upsert_courses_bulk(rows) -> None:
+    """
+    Create or update many course records in a single transaction.
+
+    Parameters:
+        rows (Iterable[tuple]): (course_id, course_name, instructor_id) tuples. A course whose ID
+                                already exists takes the name and instructor of its row.
+
+    Returns:
+        None
+    """
+    # The conflict check and the insert or update are one statement per row
+    with _CONN:
+        _CONN.executemany(
+            "INSERT INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?) "
+            "ON CONFLICT(course_id) DO UPDATE SET course_name = excluded.course_name, "
+            "instructor_id = excluded.instructor_id",
+            rows
+        )
+    _forget_rows('courses')
+    invalidate_lists('courses')
 
 
 def read_course(course_id: str):
@@ -229,15 +640,8 @@ def read_course(course_id: str):
         tuple | None: A tuple containing course details (course_id, course_name, instructor_id),
                       or None if no record is found.
     """
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-
-    # Query the course by ID
-    cursor.execute("SELECT * FROM courses WHERE course_id = ?", (course_id,))
-    result = cursor.fetchone()
-
-    db.close()
-    return result
+    # Query the course by ID, unless the row is cached
+    return _cached_row('courses', course_id, "SELECT * FROM courses WHERE course_id = ?")
 
 
 def update_course(course_id: str, course_name: str = None, instructor_id: str = None) -> None:
@@ -252,25 +656,20 @@ def update_course(course_id: str, course_name: str = None, instructor_id: str =
     Returns:
         None
     """
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-
-    # Update course name if provided
-    if course_name:
-        cursor.execute(
-            "UPDATE courses SET course_name = ? WHERE course_id = ?",
-            (course_name, course_id)
-        )
+    course_name = course_name or None
+    if course_name is None and instructor_id is None:
+        return
+    with _CONN:
+        cursor = _CONN.cursor()
 
-    # Update instructor if provided
-    if instructor_id is not None:
+        # Change the provided fields in a single statement
         cursor.execute(
-            "UPDATE courses SET instructor_id = ? WHERE course_id = ?",
-            (instructor_id, course_id)
+            "UPDATE courses SET course_name = COALESCE(?, course_name), "
+            "instructor_id = COALESCE(?, instructor_id) WHERE course_id = ?",
+            (course_name, instructor_id, course_id)
         )
-
-    db.commit()
-    db.close()
+    _forget_rows('courses', course_id)
+    invalidate_lists('courses')
 
 
 def delete_course(course_id: str) -> None:
@@ -283,17 +682,13 @@ def delete_course(course_id: str) -> None:
     Returns:
         None
     """
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-
-    # Remove registrations tied to this course
-    cursor.execute("DELETE FROM registrations WHERE course_id = ?", (course_id,))
-
-    # Remove the course itself
-    cursor.execute("DELETE FROM courses WHERE course_id = ?", (course_id,))
+    with _CONN:
+        cursor = _CONN.cursor()
 
-    db.commit()
-    db.close()
+        # Registrations tied to this course go with it (ON DELETE CASCADE)
+        cursor.execute("DELETE FROM courses WHERE course_id = ?", (course_id,))
+    _forget_rows('courses', course_id)
+    invalidate_lists('courses')
 
 def create_registration(student_id: str, course_id: str) -> None:
     """
@@ -306,17 +701,90 @@ def create_registration(student_id: str, course_id: str) -> None:
     Returns:
         None
     """
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
+    with _CONN:
+        cursor = _CONN.cursor()
 
-    # Insert a new registration row
-    cursor.execute(
-        "INSERT INTO registrations (student_id, course_id) VALUES (?, ?)",
-        (student_id, course_id)
-    )
+        # Insert a new registration row
+        cursor.execute(
+            "INSERT INTO registrations (student_id, course_id) VALUES (?, ?)",
+            (student_id, course_id)
+        )
+
+
+def try_create_registration(student_id: str, course_id: str) -> bool:
+    """
+    Register a student in a course unless they are already registered in it.
 
-    db.commit()
-    db.close()
+    Parameters:
+        student_id (str): The ID of the student enrolling.
+        course_id (str): The ID of the course being registered for.
+
+    Returns:
+        bool: True if the registration was added, False if the student was already registered in the course.
+    """
+    with _CONN:
+        cursor = _CONN.cursor()
+
+        # The unique (student_id, course_id) index turns a duplicate into a no-op
+        cursor.execute(
+            "INSERT OR IGNORE INTO registrations (student_id, course_id) VALUES (?, ?)",
+            (student_id, course_id)
+        )
+        return cursor.rowcount > 0
+
+
+def insert_missing(instructors, students, courses, registrations) -> None:
+    """
+    Insert the records of an imported snapshot that the database doesn't hold yet, in a single transaction.
+
+    Records whose ID (or student/course pair) already exists are skipped. Instructors and students go in
+    before the courses and registrations that refer to them.
+
+    Parameters:
+        instructors (Iterable[tuple]): (instructor_id, name, age, email) tuples.
+        students (Iterable[tuple]): (student_id, name, age, email) tuples.
+        courses (Iterable[tuple]): (course_id, course_name, instructor_id) tuples.
+        registrations (Iterable[tuple]): (student_id, course_id) tuples.
+
+    Returns:
+        None
+    """
+    with _CONN:
+        _CONN.executemany(
+            "INSERT OR IGNORE INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?)",
+            instructors
+        )
+        _CONN.executemany(
+            "INSERT OR IGNORE INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?)",
+            students
+        )
+        _CONN.executemany(
+            "INSERT OR IGNORE INTO courses (course_id, course_name, instructor_id) VALUES (?, ?, ?)",
+            courses
+        )
+        _CONN.executemany(
+            "INSERT OR IGNORE INTO registrations (student_id, course_id) VALUES (?, ?)",
+            registrations
+        )
+    invalidate_lists()
+
+
+def bulk_create_registrations(rows) -> None:
+    """
+    Create many registration records in a single transaction.
+
+    Parameters:
+        rows (Iterable[tuple]): (student_id, course_id) tuples.
+
+    Returns:
+        None
+    """
+    # One executemany and one commit for all rows; a rejected row rolls back the whole batch
+    with _CONN:
+        _CONN.executemany(
+            "INSERT INTO registrations (student_id, course_id) VALUES (?, ?)",
+            rows
+        )
 
 
 def read_registration(registration_id: int):
@@ -330,8 +798,7 @@ def read_registration(registration_id: int):
         tuple | None: A tuple containing registration details (registration_id, student_id, course_id),
                       or None if no record is found.
     """
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
+    cursor = _CONN.cursor()
 
     cursor.execute(
         "SELECT * FROM registrations WHERE registration_id = ?",
@@ -339,7 +806,6 @@ def read_registration(registration_id: int):
     )
     result = cursor.fetchone()
 
-    db.close()
     return result
 
 
@@ -355,26 +821,20 @@ def update_registration(registration_id: int, student_id: str = None, course_id:
     Returns:
         None
     """
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-
-    # Update student if provided
-    if student_id:
-        cursor.execute(
-            "UPDATE registrations SET student_id = ? WHERE registration_id = ?",
-            (student_id, registration_id)
-        )
-
-    # Update course if provided
-    if course_id:
+    student_id = student_id or None
+    course_id = course_id or None
+    if student_id is None and course_id is None:
+        return
+    with _CONN:
+        cursor = _CONN.cursor()
+
+        # Change the provided fields in a single statement
         cursor.execute(
-            "UPDATE registrations SET course_id = ? WHERE registration_id = ?",
-            (course_id, registration_id)
+            "UPDATE registrations SET student_id = COALESCE(?, student_id), "
+            "course_id = COALESCE(?, course_id) WHERE registration_id = ?",
+            (student_id, course_id, registration_id)
         )
 
-    db.commit()
-    db.close()
-
 
 def delete_registration(registration_id: int) -> None:
     """
@@ -386,16 +846,13 @@ def delete_registration(registration_id: int) -> None:
     Returns:
         None
     """
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-
-    cursor.execute(
-        "DELETE FROM registrations WHERE registration_id = ?",
-        (registration_id,)
-    )
+    with _CONN:
+        cursor = _CONN.cursor()
 
-    db.commit()
-    db.close()
+        cursor.execute(
+            "DELETE FROM registrations WHERE registration_id = ?",
+            (registration_id,)
+        )
 
 def list_students():
     '''
@@ -404,12 +861,12 @@ def list_students():
     Return Value: this function will return a list of tupples of the students and there information present in the table 
     and if the students table is empty it will return an empty list
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-    cursor.execute("SELECT student_id, name, age, email FROM students ORDER BY name")
-    rows = cursor.fetchall()
-    db.close()
-    return rows
+    rows = _LIST_CACHE.get('students')
+    if rows is None:
+        cursor = _CONN.cursor()
+        cursor.execute(_LIST_SQL['students'])
+        rows = _LIST_CACHE['students'] = cursor.fetchall()
+    return list(rows)
 
 def list_instructors():
 
@@ -419,12 +876,12 @@ def list_instructors():
     Return Value: this function will return a list of tupples of the instructors and there information present in the table 
     and if the instructor table is empty it will return an empty list.
     '''
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
-    cursor.execute("SELECT instructor_id, name, age, email FROM instructors ORDER BY name")
-    rows = cursor.fetchall()
-    db.close()
-    return rows
+    rows = _LIST_CACHE.get('instructors')
+    if rows is None:
+        cursor = _CONN.cursor()
+        cursor.execute(_LIST_SQL['instructors'])
+        rows = _LIST_CACHE['instructors'] = cursor.fetchall()
+    return list(rows)
 
 def list_courses():
     """
@@ -437,21 +894,128 @@ def list_courses():
         list[tuple]: A list of tuples in the format (course_id, course_name, instructor_name).
                      If an instructor is not assigned, the instructor_name will be an empty string.
     """
-    db = sqlite3.connect('database.db')
-    cursor = db.cursor()
+    # The joined rows are kept until a course or instructor is written
+    rows = _LIST_CACHE.get('courses')
+    if rows is None:
+        cursor = _CONN.cursor()
 
-    # Join courses with instructors to display instructor names
+        # Join courses with instructors to display instructor names
+        cursor.execute(_LIST_SQL['courses'])
+
+        rows = _LIST_CACHE['courses'] = cursor.fetchall()
+
+    return list(rows)
+
+def fetch_list(table):
+    '''
+    Functionality: this function runs the query of list_students, list_instructors or list_courses on a pooled connection,
+    so a worker thread can load a list while the GUI thread keeps using the other functions of this module.
+    the rows are not stored in the list cache, a write made meanwhile on the shared connection could make them stale.
+    Parameters: table is 'students', 'instructors' or 'courses'
+    Return Value: the same list of tuples as the matching list_* function
+    '''
+    with borrow() as con:
+        return con.execute(_LIST_SQL[table]).fetchall()
+
+
+def _columns(rows, names):
+    '''
+    Functionality: this function turns a list of rows into one tuple per column with a single zip(*rows).
+    Parameters: rows is the list of row tuples and names are the column names in the order of the rows
+    Return value: a dict mapping each column name to the tuple of its values, the tuples are empty when there are no rows
+    '''
+    columns = list(zip(*rows)) or [()] * len(names)
+    return dict(zip(names, columns))
+
+def list_students_columnar():
+    '''
+    Functionality: this function returns the same students as list_students, in the same order, but column by column
+    for callers that only read one or two of the columns.
+    parameters: None
+    Return Value: a dict with the keys student_id, name, age and email, each mapped to a tuple of the values of that column
+    '''
+    return _columns(list_students(), ('student_id', 'name', 'age', 'email'))
+
+def list_instructors_columnar():
+    '''
+    Functionality: this function returns the same instructors as list_instructors, in the same order, but column by column.
+    parameters: None
+    Return Value: a dict with the keys instructor_id, name, age and email, each mapped to a tuple of the values of that column
+    '''
+    return _columns(list_instructors(), ('instructor_id', 'name', 'age', 'email'))
+
+def list_courses_columnar():
+    """
+    List all courses like list_courses, transposed into one tuple per column.
+
+    Parameters:
+        None
+
+    Returns:
+        dict[str, tuple]: The keys course_id, course_name and instructor_name, each mapped to
+                          the values of that column in list_courses order.
+    """
+    return _columns(list_courses(), ('course_id', 'course_name', 'instructor_name'))
+
+def find_students(text):
+    '''
+    Functionality: this function returns the students matching the text typed in a search box, in the order of list_students.
+    the matching runs in SQLite on the students_fts index, every word of the text must start a word of the id, name or email.
+    Parameters: text is the search text, with an empty text every student is returned
+    Return Value: a list of (student_id, name, age, email) tuples
+    '''
+    if not text.strip():
+        return list_students()
+    cursor = _CONN.cursor()
+    cursor.execute(
+        "SELECT student_id, name, age, email FROM students "
+        "WHERE rowid IN (SELECT rowid FROM students_fts WHERE students_fts MATCH ?) ORDER BY name",
+        (fts_query(text),),
+    )
+    return cursor.fetchall()
+
+def find_instructors(text):
+    '''
+    Functionality: this function returns the instructors matching the search text on the instructors_fts index, like find_students.
+    Parameters: text is the search text, with an empty text every instructor is returned
+    Return Value: a list of (instructor_id, name, age, email) tuples
+    '''
+    if not text.strip():
+        return list_instructors()
+    cursor = _CONN.cursor()
+    cursor.execute(
+        "SELECT instructor_id, name, age, email FROM instructors "
+        "WHERE rowid IN (SELECT rowid FROM instructors_fts WHERE instructors_fts MATCH ?) ORDER BY name",
+        (fts_query(text),),
+    )
+    return cursor.fetchall()
+
+def find_courses(text):
+    """
+    List the courses matching a search text, in the format and order of list_courses.
+
+    Parameters:
+        text (str): The search text. A course matches when every word starts a word of its
+                    ID or name, or of its instructor. An empty text returns every course.
+
+    Returns:
+        list[tuple]: (course_id, course_name, instructor_name) tuples.
+    """
+    if not text.strip():
+        return list_courses()
+    cursor = _CONN.cursor()
+
+    # ?1 is used twice: once for the course's own fields and once for its instructor
     cursor.execute("""
         SELECT c.course_id, c.course_name, COALESCE(i.name, '')
         FROM courses c
         LEFT JOIN instructors i ON i.instructor_id = c.instructor_id
+        WHERE c.rowid IN (SELECT rowid FROM courses_fts WHERE courses_fts MATCH ?1)
+           OR i.rowid IN (SELECT rowid FROM instructors_fts WHERE instructors_fts MATCH ?1)
         ORDER BY c.course_name
-    """)
+    """, (fts_query(text),))
 
-    rows = cursor.fetchall()
-
-    db.close()
-    return rows
+    return cursor.fetchall()
 
 
 def backup_database(backup_path: str = None) -> str:
@@ -472,13 +1036,20 @@ def backup_database(backup_path: str = None) -> str:
         dirpath = backup_path if backup_path and os.path.isdir(backup_path) else "."
         backup_path = os.path.join(dirpath, fname)
 
-    src = sqlite3.connect('database.db')
-    dst = sqlite3.connect(backup_path)
-    with dst:
-        src.backup(dst)
-
-    src.close()
-    dst.close()
+    # VACUUM INTO writes a compacted copy in one statement without opening the backup file as a
+    # second connection. It is written next to the target, flushed to disk and then renamed over it,
+    # so a crash never leaves a half-written backup or loses the previous one.
+    tmp_path = backup_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        _CONN.execute("VACUUM INTO ?", (tmp_path,))
+        # opened for writing since fsync on Windows rejects a read-only descriptor
+        with open(tmp_path, "r+b") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, backup_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     return backup_path
-
-create_table()
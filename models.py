@@ -2,6 +2,33 @@ from typing import Dict
 import json
 import re
 
+# orjson encodes and decodes in C, json is used when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack is only needed for the binary snapshots of save_snapshot/load_snapshot
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# compiled once for every Person created, instead of looking the pattern up in the re cache on each call
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
+def _dumps(obj, pretty: bool) -> bytes:
+    """
+    Encode an object as UTF-8 JSON, indented by 2 spaces when pretty and without any whitespace otherwise.
+    Non-ASCII characters are written as they are.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(obj)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    # without indent the stdlib encoder stays in its C implementation
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 class Person():
     '''
     Functionality: this class stores a persons name, age and email and it will check if the age is negative or not and will check if the email is in the correct format.
@@ -16,6 +43,9 @@ class Person():
     -  __init__(name, age, email): this method initialze the name age and the email and makes sure that the age and the email are valid
     - introduce: this method return a string where it is introducing a person. 
     '''
+    # fixed attributes instead of a per-instance __dict__, the subclasses add their own
+    __slots__ = ('name', 'age', '_email')
+
     def __init__(self, name: str, age: int, email: str):
         '''
         Functionality: it will initilaze a new person instance.
@@ -31,7 +61,7 @@ class Person():
         '''
         if age < 0:
             raise ValueError(" The age can't be negative")
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+        if not _EMAIL_RE.match(email):
             raise ValueError("The email entered is not valid")
         self.name = name
         self.age = age
@@ -64,6 +94,8 @@ class Student(Person):
     - register_course(course): this method register courses to student and return a confirmation message.  
 
     '''
+    __slots__ = ('student_id', 'registered_courses')
+
     def __init__(self, name: str, age: int, email: str, student_id: str):
         '''
         Functionality: it will initilaze a new student instance. 
@@ -76,10 +108,27 @@ class Student(Person):
 
         Return Value: it returns None.
         '''
-         super().__init__(name, age, email)
+        super().__init__(name, age, email)
         self.student_id= student_id
         self.registered_courses = []
-        return f"My name is {self.name} and I am {self.age} years old."
+
+    @classmethod
+    def _from_trusted(cls, name: str, age: int, email: str, student_id: str, registered_courses: list):
+        '''
+        Functionality: it creates a student from data that was already validated (a snapshot this program saved)
+        without running the age and email checks of __init__.
+
+        Parameter: the 4 parameters of __init__ and registered_courses, the list of course names of the student.
+
+        Return Value: the new Student.
+        '''
+        st = object.__new__(cls)
+        st.name = name
+        st.age = age
+        st._email = email
+        st.student_id = student_id
+        st.registered_courses = registered_courses
+        return st
    
     def register_course(self, course: str):
         '''
@@ -109,6 +158,8 @@ class Instructor(Person):
     - __init__(name, age, email, instructor_id): it initializes the instructor instance with personal and instructor specific data
     - assign_course(course): it assigns the instructor to a new course and returns a confirmation message.
     '''
+    __slots__ = ('instructor_id', 'assigned_courses')
+
     def __init__(self, name: str, age: int, email: str, instructor_id: str):
         '''
         Functionality: it will initilaze a new instructor instance. 
@@ -124,6 +175,23 @@ class Instructor(Person):
         super().__init__(name, age, email)
         self.instructor_id = instructor_id
         self.assigned_courses= []
+
+    @classmethod
+    def _from_trusted(cls, name: str, age: int, email: str, instructor_id: str, assigned_courses: list):
+        '''
+        Functionality: it creates an instructor from already validated data without running the checks of __init__.
+
+        Parameter: the 4 parameters of __init__ and assigned_courses, the list of course names of the instructor.
+
+        Return Value: the new Instructor.
+        '''
+        ins = object.__new__(cls)
+        ins.name = name
+        ins.age = age
+        ins._email = email
+        ins.instructor_id = instructor_id
+        ins.assigned_courses = assigned_courses
+        return ins
     
     def assign_course(self, course: str):
         self.assigned_courses.append(course)
@@ -139,6 +207,7 @@ class Course:
         instructor (Instructor | None): Instructor teaching the course.
         enrolled_students (list[Student]): Students enrolled in this course.
     """
+    __slots__ = ('course_id', 'course_name', 'instructor', 'enrolled_students')
 
     def __init__(self, course_id: str, course_name: str, instructor: Instructor):
         """
@@ -168,6 +237,54 @@ class Course:
         return f"{student.name} is enrolled in the {self.course_name} course"
 
 
+def _student_record(s: Student) -> dict:
+    """Serializable form of a student."""
+    return {
+        "name": s.name,
+        "age": s.age,
+        "email": s._email,
+        "student_id": s.student_id,
+        "registered_courses": s.registered_courses,
+    }
+
+
+def _instructor_record(i: Instructor) -> dict:
+    """Serializable form of an instructor."""
+    return {
+        "name": i.name,
+        "age": i.age,
+        "email": i._email,
+        "instructor_id": i.instructor_id,
+        "assigned_courses": i.assigned_courses,
+    }
+
+
+def _course_record(c: Course, student_refs: dict) -> dict:
+    """
+    Serializable form of a course, the instructor and students are referenced by ID and name.
+
+    Args:
+        c (Course): The course to serialize.
+        student_refs (dict[int, dict]): {"id", "name"} references of the database's students keyed by
+            id() of the Student, shared by every course they are enrolled in.
+    """
+    return {
+        "course_id": c.course_id,
+        "course_name": c.course_name,
+        "instructor": (
+            {
+                "id": c.instructor.instructor_id,
+                "name": c.instructor.name,
+            }
+            if c.instructor else None
+        ),
+        "enrolled_students": [
+            student_refs.get(id(s)) or {"id": s.student_id, "name": s.name}
+            for s in c.enrolled_students
+        ],
+    }
+
+
 class SchoolDB:
     """
     Represents a school database that stores students, instructors, and courses.
@@ -192,97 +309,160 @@ class SchoolDB:
             dict: JSON-serializable dictionary containing all data.
         """
         return {
-            "students": [
-                {
-                    "name": s.name,
-                    "age": s.age,
-                    "email": s._email,
-                    "student_id": s.student_id,
-                    "registered_courses": list(s.registered_courses),
-                }
-                for s in self.students.values()
-            ],
-            "instructors": [
-                {
-                    "name": i.name,
-                    "age": i.age,
-                    "email": i._email,
-                    "instructor_id": i.instructor_id,
-                    "assigned_courses": i.assigned_courses,
-                }
-                for i in self.instructors.values()
-            ],
-            "courses": [
-                {
-                    "course_id": c.course_id,
-                    "course_name": c.course_name,
-                    "instructor": (
-                        {
-                            "id": c.instructor.instructor_id,
-                            "name": c.instructor.name,
-                        }
-                        if c.instructor else None
-                    ),
-                    "enrolled_students": [
-                        {"id": s.student_id, "name": s.name}
-                        for s in c.enrolled_students
-                    ],
-                }
-                for c in self.courses.values()
-            ],
+            key: [record(item) for item in items]
+            for key, items, record in self._sections()
         }
 
+    def _sections(self):
+        """
+        List the sections of the serialized database.
+
+        Returns:
+            tuple: (key, objects, record function) for the students, instructors and courses,
+                   in the order they appear in the dictionary and the JSON file.
+        """
+        # one reference per student, reused by all of their courses instead of being rebuilt for each enrollment
+        student_refs = {id(s): {"id": s.student_id, "name": s.name} for s in self.students.values()}
+        return (
+            ("students", self.students.values(), _student_record),
+            ("instructors", self.instructors.values(), _instructor_record),
+            ("courses", self.courses.values(), lambda c: _course_record(c, student_refs)),
+        )
+
 
     @classmethod
-    def from_dictionary(cls, payload: Dict):
+    def from_dictionary(cls, payload: Dict, trusted: bool = False):
+        """
+        Build a SchoolDB from a dictionary in the format of to_dictionary.
+
+        Args:
+            payload (dict): The students, instructors and courses to load.
+            trusted (bool): The payload was saved by this program, so the age and email checks of
+                Person are skipped. Leave it False for files coming from anywhere else.
+        """
         db = cls()
         
         for s in payload.get("students",[]):
-            st= Student(
-                name=s["name"],
-                age=s["age"],
-                email= s["email"],
-                student_id=s["student_id"],
-            )
-            st.registered_courses = list(s.get("registered_courses", []))
+            if trusted:
+                st = Student._from_trusted(
+                    s["name"], s["age"], s["email"], s["student_id"], s.get("registered_courses", [])
+                )
+            else:
+                st= Student(
+                    name=s["name"],
+                    age=s["age"],
+                    email= s["email"],
+                    student_id=s["student_id"],
+                )
+                st.registered_courses = list(s.get("registered_courses", []))
             db.students[st.student_id]= st
 
         for i in payload.get("instructors", []):
-            ins = Instructor(
-                name=i["name"],
-                age=i["age"],
-                email=i["email"],
-                instructor_id=i["instructor_id"],
-            )
-            ins.assigned_courses = list(i.get("assigned_courses", []))
+            if trusted:
+                ins = Instructor._from_trusted(
+                    i["name"], i["age"], i["email"], i["instructor_id"], i.get("assigned_courses", [])
+                )
+            else:
+                ins = Instructor(
+                    name=i["name"],
+                    age=i["age"],
+                    email=i["email"],
+                    instructor_id=i["instructor_id"],
+                )
+                ins.assigned_courses = list(i.get("assigned_courses", []))
             db.instructors[ins.instructor_id] = ins
         
+        # bound once for all the courses instead of looking the methods up for every enrolled student
+        get_student = db.students.get
+        get_instructor = db.instructors.get
         for c in payload.get("courses", []):
             instr_info = c.get("instructor")
             instructor = None
             if instr_info:
-                instructor = db.instructors.get(instr_info.get("id"))  
+                instructor = get_instructor(instr_info.get("id"))
             co = Course(
                 course_id=c["course_id"],
                 course_name=c["course_name"],
                 instructor=instructor,  
             )
-            for s in c.get("enrolled_students", []):
-                student = db.students.get(s["id"])
-                if student:
-                    co.enrolled_students.append(student)
+            # students missing from the snapshot are skipped
+            co.enrolled_students.extend(
+                filter(None, (get_student(s["id"]) for s in c.get("enrolled_students", [])))
+            )
             db.courses[co.course_id] = co
         return db
     
-    def save_json(self, path: str):
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dictionary(), f, ensure_ascii=False, indent=2)
+    def save_json(self, path: str, pretty: bool = False):
+        """
+        Save the database as a JSON file.
+
+        Args:
+            path (str): Path of the JSON file.
+            pretty (bool): Indent the file by 2 spaces for reading it, the default writes compact JSON.
+        """
+        # Records are encoded and written one at a time instead of building the whole dictionary first;
+        # when pretty each one is indented to its depth so the file is the same as json.dump(..., indent=2).
+        indent, item_indent = (b"\n  ", b"\n    ") if pretty else (b"", b"")
+        with open(path, "wb", buffering=1 << 20) as f:
+            f.write(b"{")
+            for n, (key, items, record) in enumerate(self._sections()):
+                f.write(b"," + indent if n else indent)
+                f.write(b'"' + key.encode() + (b'": [' if pretty else b'":['))
+                first = True
+                for item in items:
+                    f.write(item_indent if first else b"," + item_indent)
+                    data = _dumps(record(item), pretty)
+                    f.write(data.replace(b"\n", item_indent) if pretty else data)
+                    first = False
+                f.write(b"]" if first else indent + b"]")
+            f.write(b"\n}" if pretty else b"}")
 
     @classmethod
-    def load_json(cls, path: str):
-        with open(path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-        return cls.from_dictionary(payload)
+    def load_json(cls, path: str, trusted: bool = False):
+        if orjson is not None:
+            with open(path, "rb") as f:
+                payload = orjson.loads(f.read())
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        return cls.from_dictionary(payload, trusted)
+
+    def save_snapshot(self, path: str):
+        """
+        Save the database as a binary msgpack snapshot, a smaller and faster alternative to save_json
+        for files only read back by load_snapshot.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required to save a binary snapshot")
+        with open(path, "wb") as f:
+            f.write(msgpack.packb(self.to_dictionary(), use_bin_type=True))
+
+    @classmethod
+    def load_snapshot(cls, path: str, trusted: bool = False):
+        """
+        Load a database saved by save_snapshot.
+
+        Args:
+            path (str): Path of the snapshot file.
+            trusted (bool): Skip the age and email checks, see from_dictionary.
+
+        Returns:
+            SchoolDB: The loaded database.
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        if msgpack is None:
+            raise ImportError("msgpack is required to load a binary snapshot")
+        with open(path, "rb") as f:
+            payload = msgpack.unpackb(f.read(), raw=False)
+        return cls.from_dictionary(payload, trusted)
     
 if __name__ == "__main__":
     person= Person("Lana", 20, "lana.houri@gmail.com")
@@ -311,6 +491,6 @@ if __name__ == "__main__":
     db.students[stu.student_id] = stu
     db.courses[c.course_id] = c
 
-    db.save_json("uni_data.json")
+    db.save_json("uni_data.json", pretty=True)
     db2 = SchoolDB.load_json("uni_data.json")
     print(db2.students["S-100"].introduce())
@@ -1,14 +1,33 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import re
+import queue
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from database import (
-    list_students, list_instructors, list_courses,
+    fetch_list,
+    list_instructors_columnar, list_courses_columnar,
+    find_students, find_instructors, find_courses,
     create_student, update_student, delete_student, read_student,
     create_instructor, update_instructor, delete_instructor, read_instructor,
     create_course, update_course, delete_course, read_course,
-    create_registration
+    create_registration, create_table
 )
 
+# Email format check shared by the add and edit forms, compiled once
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
+# Mouse wheel event sequences handled by ScrollFrame
+_WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+# fill_tree inserts this many rows per event loop turn, so a large table never
+# blocks the window for long; the first batch covers every visible row
+_FILL_BATCH = 200
+
+# Pending after() job of each tree still being filled by fill_tree
+_fill_jobs = {}
+
 '''
 School Management System GUI (Tkinter)
 
@@ -24,6 +43,149 @@ parameters, and return values. Inline comments explain step-by-step logic.
 '''
 
 
+def fill_tree(tree, rows):
+    '''
+    Replace all rows of a Treeview.
+
+    The old rows are removed with one delete call and the first _FILL_BATCH new
+    ones are inserted right away, so Tk redraws the visible part of the table once
+    when the handler returns. The remaining rows are appended one batch per event
+    loop turn, so the window keeps responding while a large table fills; calling
+    fill_tree again on the same tree cancels the rest of the previous fill.
+    Each row's item id is its first value (the record ID), so a single row can
+    later be updated or removed in place.
+
+    Parameters:
+        tree (ttk.Treeview): The table to fill.
+        rows (Iterable[tuple]): Row values in column order.
+
+    Returns:
+        None
+    '''
+    job = _fill_jobs.pop(tree, None)
+    if job is not None:
+        tree.after_cancel(job)
+    tree.delete(*tree.get_children())
+    _fill_batch(tree, iter(rows))
+
+
+def _fill_batch(tree, rows):
+    '''
+    Append the next batch of rows started by fill_tree and schedule the one after.
+
+    Parameters:
+        tree (ttk.Treeview): The table being filled.
+        rows (Iterator[tuple]): The rows not inserted yet.
+
+    Returns:
+        None
+    '''
+    _fill_jobs.pop(tree, None)
+    insert = tree.insert
+    count = 0
+    for row in islice(rows, _FILL_BATCH):
+        insert("", "end", iid=row[0], values=row)
+        count += 1
+    # A full batch means there may be more rows left
+    if count == _FILL_BATCH:
+        _fill_jobs[tree] = tree.after(1, _fill_batch, tree, rows)
+
+
+def debounce(entry, delay_ms, callback):
+    '''
+    Build a key event handler that runs callback once typing pauses.
+
+    Every key that changes the entry's text cancels the run scheduled by the
+    previous one and schedules a new one delay_ms later with entry.after, so a
+    burst of keystrokes triggers a single search instead of one per key. Keys
+    that leave the text as it was (arrows, Shift, Home, ...) schedule nothing.
+
+    Parameters:
+        entry (ttk.Entry): Search box whose text is watched.
+        delay_ms (int): Quiet time in milliseconds before callback runs.
+        callback (Callable[[], None]): Function to run.
+
+    Returns:
+        Callable[[tk.Event], None]: The handler to bind to <KeyRelease>.
+    '''
+    pending = [None]
+    # Text of the entry when the last key was handled
+    last_text = [entry.get()]
+
+    def run():
+        pending[0] = None
+        callback()
+
+    def cancel():
+        if pending[0] is not None:
+            entry.after_cancel(pending[0])
+            pending[0] = None
+
+    def handler(event):
+        text = entry.get()
+        # Return already runs the search right away through its own binding
+        if event.keysym in ("Return", "KP_Enter"):
+            cancel()
+            last_text[0] = text
+            return
+        if text == last_text[0]:
+            return
+        last_text[0] = text
+        cancel()
+        pending[0] = entry.after(delay_ms, run)
+
+    return handler
+
+
+def validate_person(name, age_txt, email):
+    '''
+    Check the fields shared by the student and instructor forms.
+
+    Parameters:
+        name (str): Stripped name text.
+        age_txt (str): Stripped age text.
+        email (str): Stripped email text.
+
+    Returns:
+        int: The parsed age.
+
+    Raises:
+        ValueError: With the message to show when a field is missing, the age is
+        not a non-negative integer, or the email format is invalid.
+    '''
+    if not name or not age_txt or not email:
+        raise ValueError("All fields are required.")
+    # Parse the age once, anything but a non-negative integer is rejected
+    try:
+        age = int(age_txt)
+    except ValueError:
+        age = -1
+    if age < 0:
+        raise ValueError("Age must be a non-negative integer.")
+    # basic regex for email validity
+    if not _EMAIL_RE.match(email):
+        raise ValueError("Invalid email format.")
+    return age
+
+
+def add_entry(parent, row, label):
+    '''
+    Add a labelled text entry on one row of a two-column form.
+
+    Parameters:
+        parent (tk.Widget): Container laid out with grid.
+        row (int): Grid row used by the label and the entry.
+        label (str): Text shown in the label column.
+
+    Returns:
+        ttk.Entry: The new entry widget.
+    '''
+    ttk.Label(parent, text=label).grid(row=row, column=0, sticky="e", padx=(0, 8), pady=3)
+    entry = ttk.Entry(parent, width=32)
+    entry.grid(row=row, column=1, sticky="ew", pady=3)
+    return entry
+
+
 class ScrollFrame(ttk.Frame):
     '''
     A scrollable frame widget using a Canvas and an inner Frame.
@@ -72,12 +234,46 @@ class ScrollFrame(ttk.Frame):
         self.canvas.pack(side="left", fill="both", expand=True)
         vbar.pack(side="right", fill="y")
 
-        # Bind mouse wheel events for cross-platform scrolling
-        # Windows/Mac send <MouseWheel> with event.delta
-        # Linux often sends Button-4 (scroll up) and Button-5 (scroll down)
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
+        # Mouse wheel events are only bound while the pointer is over the frame,
+        # so wheel notches elsewhere are not dispatched to _on_mousewheel
+        self.bind("<Enter>", self._bind_mousewheel)
+        self.bind("<Leave>", self._unbind_mousewheel)
+
+    def _bind_mousewheel(self, event):
+        '''
+        Start handling mouse wheel events when the pointer enters the frame.
+
+        Windows/Mac send <MouseWheel> with event.delta, Linux often sends
+        Button-4 (scroll up) and Button-5 (scroll down). The bindings are global
+        so the wheel also scrolls while the pointer is over a child widget.
+
+        Parameters:
+            event (tk.Event): The <Enter> event object.
+
+        Returns:
+            None
+        '''
+        for sequence in _WHEEL_EVENTS:
+            self.canvas.bind_all(sequence, self._on_mousewheel)
+
+    def _unbind_mousewheel(self, event):
+        '''
+        Stop handling mouse wheel events when the pointer leaves the frame.
+
+        Tk also sends <Leave> when the pointer moves onto a child widget, so the
+        bindings are kept while the pointer is still inside the frame.
+
+        Parameters:
+            event (tk.Event): The <Leave> event object.
+
+        Returns:
+            None
+        '''
+        under = self.winfo_containing(event.x_root, event.y_root)
+        if under is not None and (under is self or str(under).startswith(str(self) + ".")):
+            return
+        for sequence in _WHEEL_EVENTS:
+            self.canvas.unbind_all(sequence)
 
     def _on_mousewheel(self, event):
         '''
@@ -113,6 +309,9 @@ def run_app():
     Returns:
         None
     '''
+    # Make sure the tables exist before any list is read
+    create_table()
+
     # -----------------------
     # Root window setup
     # -----------------------
@@ -136,6 +335,102 @@ def run_app():
     menubar.add_cascade(label="File", menu=filemenu)
     root.config(menu=menubar)
 
+    # -----------------------
+    # Background list loading
+    # -----------------------
+    # Full-table refreshes run their query on a worker thread, which posts
+    # <<RowsLoaded>>; the rows are then put in the tree on the Tk thread.
+    loader = ThreadPoolExecutor(max_workers=2)
+    loaded = queue.Queue()
+    # Latest load requested for each tree as (future, table), results of older loads are dropped
+    pending_loads = {}
+
+    def load_tree(tree, table):
+        '''
+        Start loading every row of a table into a tree without blocking the GUI.
+
+        Parameters:
+            tree (ttk.Treeview): The table to fill once the rows arrive.
+            table (str): 'students', 'instructors' or 'courses' (see fetch_list).
+
+        Returns:
+            None
+        '''
+        future = loader.submit(fetch_list, table)
+        pending_loads[tree] = (future, table)
+
+        def done(f):
+            # Runs on the worker thread: hand the result over to the Tk thread
+            loaded.put((tree, f))
+            try:
+                root.event_generate("<<RowsLoaded>>", when="tail")
+            except (tk.TclError, RuntimeError):
+                # Window closed, or mainloop not started yet (drained at startup)
+                pass
+
+        future.add_done_callback(done)
+
+    def on_rows_loaded(event=None):
+        '''
+        Fill the trees whose rows were loaded by load_tree.
+
+        Parameters:
+            event (tk.Event | None): The <<RowsLoaded>> event, unused.
+
+        Returns:
+            None
+        '''
+        while True:
+            try:
+                tree, future = loaded.get_nowait()
+            except queue.Empty:
+                return
+            # Skip loads replaced by a newer load or by search results
+            pending = pending_loads.get(tree)
+            if pending is None or pending[0] is not future:
+                continue
+            del pending_loads[tree]
+            try:
+                rows = future.result()
+            except Exception as e:
+                messagebox.showerror("Error", str(e))
+                continue
+            fill_tree(tree, rows)
+
+    root.bind("<<RowsLoaded>>", on_rows_loaded)
+
+    def reload_if_loading(tree):
+        '''
+        Restart the load still pending for a tree after one of its rows was changed in place.
+
+        The pending load may have read its rows before the change, and filling the
+        tree with them would undo it (an added row would vanish), so that result is
+        dropped and the table is read again.
+
+        Parameters:
+            tree (ttk.Treeview): The table whose row was inserted, updated or deleted.
+
+        Returns:
+            None
+        '''
+        pending = pending_loads.get(tree)
+        if pending is not None:
+            load_tree(tree, pending[1])
+
+    def show_rows(tree, rows):
+        '''
+        Fill a tree right away, cancelling any load still running for it.
+
+        Parameters:
+            tree (ttk.Treeview): The table to fill.
+            rows (Iterable[tuple]): Row values in column order.
+
+        Returns:
+            None
+        '''
+        pending_loads.pop(tree, None)
+        fill_tree(tree, rows)
+
     # -----------------------
     # Scrollable content container
     # -----------------------
@@ -156,21 +451,10 @@ def run_app():
     )
 
     # Student form inputs: Name, Age, Email, Student ID
-    ttk.Label(content, text="Name:").grid(row=1, column=0, sticky="e", padx=(0, 8), pady=3)
-    student_name_entry = ttk.Entry(content, width=32)
-    student_name_entry.grid(row=1, column=1, sticky="ew", pady=3)
-
-    ttk.Label(content, text="Age:").grid(row=2, column=0, sticky="e", padx=(0, 8), pady=3)
-    student_age_entry = ttk.Entry(content, width=32)
-    student_age_entry.grid(row=2, column=1, sticky="ew", pady=3)
-
-    ttk.Label(content, text="Email:").grid(row=3, column=0, sticky="e", padx=(0, 8), pady=3)
-    student_email_entry = ttk.Entry(content, width=32)
-    student_email_entry.grid(row=3, column=1, sticky="ew", pady=3)
-
-    ttk.Label(content, text="Student ID:").grid(row=4, column=0, sticky="e", padx=(0, 8), pady=3)
-    student_id_entry = ttk.Entry(content, width=32)
-    student_id_entry.grid(row=4, column=1, sticky="ew", pady=3)
+    student_name_entry = add_entry(content, 1, "Name:")
+    student_age_entry = add_entry(content, 2, "Age:")
+    student_email_entry = add_entry(content, 3, "Email:")
+    student_id_entry = add_entry(content, 4, "Student ID:")
 
     def add_student_action():
         '''
@@ -184,7 +468,7 @@ def run_app():
             - Student ID does not already exist
         On success:
             - Calls create_student(sid, name, age, email)
-            - Refreshes the students treeview with refresh_students_tree()
+            - Appends the new row to the students treeview
             - Shows a success messagebox
 
         Parameters:
@@ -201,22 +485,19 @@ def run_app():
             sid = student_id_entry.get().strip()
 
             # Input validations
-            if not name or not age_txt or not email or not sid:
+            if not sid:
                 raise ValueError("All fields are required.")
-            if not age_txt.isdigit() or int(age_txt) < 0:
-                raise ValueError("Age must be a non-negative integer.")
-            # basic regex for email validity
-            if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
-                raise ValueError("Invalid email format.")
+            age = validate_person(name, age_txt, email)
             # ensure unique student ID
             if read_student(sid):
                 raise ValueError("Student ID already exists.")
 
             # Create the student via database module
-            create_student(sid, name, int(age_txt), email)
+            create_student(sid, name, age, email)
 
-            # Update UI table
-            refresh_students_tree()
+            # Update UI table with the new row only
+            students_tree.insert("", "end", iid=sid, values=(sid, name, age, email))
+            reload_if_loading(students_tree)
 
             # Inform the user
             messagebox.showinfo("Success", f"Student {name} added.")
@@ -243,21 +524,10 @@ def run_app():
     )
 
     # Instructor input fields
-    ttk.Label(content, text="Name:").grid(row=7, column=0, sticky="e", padx=(0, 8), pady=3)
-    instructor_name_entry = ttk.Entry(content, width=32)
-    instructor_name_entry.grid(row=7, column=1, sticky="ew", pady=3)
-
-    ttk.Label(content, text="Age:").grid(row=8, column=0, sticky="e", padx=(0, 8), pady=3)
-    instructor_age_entry = ttk.Entry(content, width=32)
-    instructor_age_entry.grid(row=8, column=1, sticky="ew", pady=3)
-
-    ttk.Label(content, text="Email:").grid(row=9, column=0, sticky="e", padx=(0, 8), pady=3)
-    instructor_email_entry = ttk.Entry(content, width=32)
-    instructor_email_entry.grid(row=9, column=1, sticky="ew", pady=3)
-
-    ttk.Label(content, text="Instructor ID:").grid(row=10, column=0, sticky="e", padx=(0, 8), pady=3)
-    instructor_id_entry = ttk.Entry(content, width=32)
-    instructor_id_entry.grid(row=10, column=1, sticky="ew", pady=3)
+    instructor_name_entry = add_entry(content, 7, "Name:")
+    instructor_age_entry = add_entry(content, 8, "Age:")
+    instructor_email_entry = add_entry(content, 9, "Email:")
+    instructor_id_entry = add_entry(content, 10, "Instructor ID:")
 
     def add_instructor_action():
         '''
@@ -271,7 +541,7 @@ def run_app():
             - Instructor ID not already present
         On success:
             - Calls create_instructor(iid, name, age, email)
-            - Refreshes instructors table and assign-course dropdowns
+            - Appends the new row to the instructors table
             - Shows success message
 
         Parameters:
@@ -288,21 +558,18 @@ def run_app():
             iid = instructor_id_entry.get().strip()
 
             # Validate inputs
-            if not name or not age_txt or not email or not iid:
+            if not iid:
                 raise ValueError("All fields are required.")
-            if not age_txt.isdigit() or int(age_txt) < 0:
-                raise ValueError("Age must be a non-negative integer.")
-            if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
-                raise ValueError("Invalid email format.")
+            age = validate_person(name, age_txt, email)
             if read_instructor(iid):
                 raise ValueError("Instructor ID already exists.")
 
             # Create instructor record
-            create_instructor(iid, name, int(age_txt), email)
+            create_instructor(iid, name, age, email)
 
-            # Refresh instructors and assignment-related lists
-            refresh_instructors_tree()
-            update_assign_course_list()
+            # Add the new row, the course lists are not affected
+            instructors_tree.insert("", "end", iid=iid, values=(iid, name, age, email))
+            reload_if_loading(instructors_tree)
 
             # Notify success
             messagebox.showinfo("Success", f"Instructor {name} added.")
@@ -325,17 +592,9 @@ def run_app():
     )
 
     # Course input fields: Course ID, Course Name, Instructor ID (optional)
-    ttk.Label(content, text="Course ID:").grid(row=13, column=0, sticky="e", padx=(0, 8), pady=3)
-    course_id_entry = ttk.Entry(content, width=32)
-    course_id_entry.grid(row=13, column=1, sticky="ew", pady=3)
-
-    ttk.Label(content, text="Course Name:").grid(row=14, column=0, sticky="e", padx=(0, 8), pady=3)
-    course_name_entry = ttk.Entry(content, width=32)
-    course_name_entry.grid(row=14, column=1, sticky="ew", pady=3)
-
-    ttk.Label(content, text="Instructor ID:").grid(row=15, column=0, sticky="e", padx=(0, 8), pady=3)
-    course_instructor_id_entry = ttk.Entry(content, width=32)
-    course_instructor_id_entry.grid(row=15, column=1, sticky="ew", pady=3)
+    course_id_entry = add_entry(content, 13, "Course ID:")
+    course_name_entry = add_entry(content, 14, "Course Name:")
+    course_instructor_id_entry = add_entry(content, 15, "Instructor ID:")
 
     def add_course_action():
         '''
@@ -350,7 +609,7 @@ def run_app():
             - Instructor ID exists in instructors table (read_instructor)
         On success:
             - Calls create_course(cid, cname, iid)
-            - Refreshes courses tree and course selection widgets
+            - Appends the new row to the courses tree and refreshes course selection widgets
             - Shows success message
 
         Parameters:
@@ -372,16 +631,17 @@ def run_app():
             if read_course(cid):
                 raise ValueError("Course ID already exists.")
             # Ensure the instructor id refers to an existing instructor
-            if not read_instructor(iid):
+            instructor = read_instructor(iid)
+            if not instructor:
                 raise ValueError("Instructor ID not found.")
 
             # Create new course
             create_course(cid, cname, iid)
 
-            # Refresh UI elements showing courses
-            refresh_courses_tree()
-            update_course_list()
-            update_assign_course_list()
+            # Add the new row and refresh UI elements listing courses
+            courses_tree.insert("", "end", iid=cid, values=(cid, cname, instructor[1]))
+            reload_if_loading(courses_tree)
+            update_course_choices()
 
             # Inform user
             messagebox.showinfo("Success", f"Course {cname} added.")
@@ -403,30 +663,29 @@ def run_app():
         row=17, column=0, columnspan=2, sticky="w", pady=(0, 4)
     )
 
-    ttk.Label(content, text="Student ID:").grid(row=18, column=0, sticky="e", padx=(0, 8), pady=3)
-    reg_student_id_entry = ttk.Entry(content, width=32)
-    reg_student_id_entry.grid(row=18, column=1, sticky="ew", pady=3)
+    reg_student_id_entry = add_entry(content, 18, "Student ID:")
 
     ttk.Label(content, text="Course:").grid(row=19, column=0, sticky="e", padx=(0, 8), pady=3)
     course_var = tk.StringVar()
     course_combobox = ttk.Combobox(content, textvariable=course_var, state="readonly", width=30)
     course_combobox.grid(row=19, column=1, sticky="ew", pady=3)
 
-    def update_course_list():
+    def update_course_list(vals=None):
         '''
         Update the course selection combobox used for registrations.
 
-        Reads course list via list_courses() and sets combobox values.
+        Reads the course ids via list_courses_columnar() and sets combobox values.
         If there are courses and none selected, set current selection to first.
 
         Parameters:
-            None
+            vals (tuple[str] | None): Course ids already read by the caller, if any.
 
         Returns:
             None
         '''
-        # Get list of course ids (first element in each row returned)
-        vals = [row[0] for row in list_courses()]
+        # Get the course id column
+        if vals is None:
+            vals = list_courses_columnar()["course_id"]
         course_combobox["values"] = vals
         # If values exist and nothing selected, set first
         if vals and not course_combobox.get():
@@ -444,6 +703,7 @@ def run_app():
             - Both Student ID and Course are provided
             - Student exists (read_student)
             - Course exists (read_course)
+            - Student is not already registered in the course
 
         On success:
             - Calls create_registration(sid, cid)
@@ -468,8 +728,11 @@ def run_app():
             if not read_course(cid):
                 raise ValueError("Course ID not found.")
 
-            # Create registration record
-            create_registration(sid, cid)
+            # Create registration record, the (student, course) pair is unique
+            try:
+                create_registration(sid, cid)
+            except sqlite3.IntegrityError:
+                raise ValueError("Student is already registered in this course.")
 
             # Inform user
             messagebox.showinfo("Success", "Registration saved.")
@@ -491,33 +754,46 @@ def run_app():
         row=21, column=0, columnspan=2, sticky="w", pady=(0, 4)
     )
 
-    ttk.Label(content, text="Instructor ID:").grid(row=22, column=0, sticky="e", padx=(0, 8), pady=3)
-    assign_instructor_id_entry = ttk.Entry(content, width=32)
-    assign_instructor_id_entry.grid(row=22, column=1, sticky="ew", pady=3)
+    assign_instructor_id_entry = add_entry(content, 22, "Instructor ID:")
 
     ttk.Label(content, text="Course:").grid(row=23, column=0, sticky="e", padx=(0, 8), pady=3)
     assign_course_var = tk.StringVar()
     assign_course_combobox = ttk.Combobox(content, textvariable=assign_course_var, state="readonly", width=30)
     assign_course_combobox.grid(row=23, column=1, sticky="ew", pady=3)
 
-    def update_assign_course_list():
+    def update_assign_course_list(vals=None):
         '''
         Update the combobox used for assigning instructors to courses.
 
-        Uses list_courses() to populate values and sets first item as default
+        Uses list_courses_columnar() to populate values and sets first item as default
         if none selected.
 
         Parameters:
-            None
+            vals (tuple[str] | None): Course ids already read by the caller, if any.
 
         Returns:
             None
         '''
-        vals = [row[0] for row in list_courses()]
+        if vals is None:
+            vals = list_courses_columnar()["course_id"]
         assign_course_combobox["values"] = vals
         if vals and not assign_course_combobox.get():
             assign_course_combobox.current(0)
 
+    def update_course_choices():
+        '''
+        Update both course comboboxes from a single read of the course ids.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        '''
+        vals = list_courses_columnar()["course_id"]
+        update_course_list(vals)
+        update_assign_course_list(vals)
+
     def assign_course_action():
         '''
         Assign a course to an instructor.
@@ -533,7 +809,7 @@ def run_app():
 
         On success:
             - Calls update_course(cid, instructor_id=iid)
-            - Refreshes courses tree to reflect assignment
+            - Updates the course's instructor in the courses tree
             - Shows success message
 
         Parameters:
@@ -550,7 +826,8 @@ def run_app():
             if not iid or not cid:
                 raise ValueError("Both Instructor ID and Course are required.")
             # Validate existence
-            if not read_instructor(iid):
+            instructor = read_instructor(iid)
+            if not instructor:
                 raise ValueError("Instructor ID not found.")
             if not read_course(cid):
                 raise ValueError("Course ID not found.")
@@ -558,8 +835,10 @@ def run_app():
             # Update the course record to set its instructor
             update_course(cid, instructor_id=iid)
 
-            # Refresh UI
-            refresh_courses_tree()
+            # Show the new instructor in the course's row, if it is listed
+            if courses_tree.exists(cid):
+                courses_tree.set(cid, "Instructor", instructor[1])
+            reload_if_loading(courses_tree)
             messagebox.showinfo("Success", "Instructor assigned to course.")
 
         except Exception as e:
@@ -596,7 +875,7 @@ def run_app():
 
     def refresh_students_tree():
         '''
-        Refresh the students_tree with the latest data from list_students().
+        Refresh the students_tree with the latest student list, loaded in the background.
 
         Parameters:
             None
@@ -604,11 +883,8 @@ def run_app():
         Returns:
             None
         '''
-        # Clear existing rows
-        students_tree.delete(*students_tree.get_children())
-        # Insert all students (sid, name, age, email)
-        for sid, name, age, email in list_students():
-            students_tree.insert("", "end", values=(sid, name, age, email))
+        # Replace the rows with all students (sid, name, age, email)
+        load_tree(students_tree, "students")
 
     def search_students():
         '''
@@ -617,8 +893,8 @@ def run_app():
         Reads:
             student_search_entry - search text (case-insensitive)
         Behavior:
-            - If a non-empty query q is present, only rows where q appears
-              in sid, name, or email (lowercased) are shown.
+            - If a non-empty query q is present, only rows where every word
+              of q starts a word of sid, name, or email are shown.
             - If q is empty, full list is refreshed.
 
         Parameters:
@@ -627,17 +903,13 @@ def run_app():
         Returns:
             None
         '''
-        q = student_search_entry.get().strip().lower()
-        # Clear tree
-        students_tree.delete(*students_tree.get_children())
-        rows = list_students()
-        # Filter rows
-        for sid, name, age, email in rows:
-            if q in sid.lower() or q in name.lower() or q in email.lower():
-                students_tree.insert("", "end", values=(sid, name, age, email))
+        q = student_search_entry.get().strip()
         if not q:
             # If search box empty, show full list
             refresh_students_tree()
+            return
+        # Only the matching rows come back from the database
+        show_rows(students_tree, find_students(q))
 
     def get_selected_student_id():
         '''
@@ -651,8 +923,8 @@ def run_app():
             # If nothing selected, prompt the user
             messagebox.showwarning("Select a student", "Please select a student in the table.")
             return None
-        # Return the first selected row's ID value
-        return students_tree.item(sel[0], "values")[0]
+        # Item ids are the student IDs (see fill_tree), kept as strings unlike the row values
+        return sel[0]
 
     def edit_student_action():
         '''
@@ -663,7 +935,7 @@ def run_app():
             - Fetch full row via read_student(sid)
             - Create a Toplevel window with Name, Age, Email inputs prefilled
             - On Save, validate inputs and call update_student(sid, ...)
-            - Refresh the students tree and close the dialog
+            - Update the student's row in the tree and close the dialog
 
         Parameters:
             None
@@ -705,8 +977,8 @@ def run_app():
             Save callback for edit student window.
 
             Reads and validates name_e, age_e, email_e. On success calls:
-                update_student(sid, name=name, age=int(age_txt), email=email)
-            Then refreshes students tree and closes the window.
+                update_student(sid, name=name, age=age, email=email)
+            Then updates the student's row in the tree and closes the window.
 
             Parameters:
                 None
@@ -721,18 +993,14 @@ def run_app():
                 email = email_e.get().strip()
 
                 # Basic validation
-                if not name or not age_txt or not email:
-                    raise ValueError("All fields are required.")
-                if not age_txt.isdigit() or int(age_txt) < 0:
-                    raise ValueError("Age must be a non-negative integer.")
-                if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
-                    raise ValueError("Invalid email format.")
+                age = validate_person(name, age_txt, email)
 
                 # Apply update via database function
-                update_student(sid, name=name, age=int(age_txt), email=email)
+                update_student(sid, name=name, age=age, email=email)
 
-                # Refresh UI and close dialog
-                refresh_students_tree()
+                # Update the edited row and close dialog
+                students_tree.item(sid, values=(sid, name, age, email))
+                reload_if_loading(students_tree)
                 win.destroy()
 
             except Exception as e:
@@ -749,7 +1017,7 @@ def run_app():
             - Get selected student id via get_selected_student_id()
             - Ask user for confirmation via askyesno
             - Call delete_student(sid)
-            - Refresh students tree
+            - Remove the student's row from the tree
 
         Parameters:
             None
@@ -762,9 +1030,10 @@ def run_app():
             return
         if not messagebox.askyesno("Delete", f"Delete student {sid}?"):
             return
-        # Call delete in database and refresh UI
+        # Call delete in database and drop the row from the UI
         delete_student(sid)
-        refresh_students_tree()
+        students_tree.delete(sid)
+        reload_if_loading(students_tree)
 
     # Small frame for Edit/Delete buttons aligned to the students table
     students_btns = ttk.Frame(content)
@@ -794,7 +1063,7 @@ def run_app():
 
     def refresh_instructors_tree():
         '''
-        Refresh the instructors_tree with data from list_instructors().
+        Refresh the instructors_tree with the instructor list, loaded in the background.
 
         Parameters:
             None
@@ -802,9 +1071,7 @@ def run_app():
         Returns:
             None
         '''
-        instructors_tree.delete(*instructors_tree.get_children())
-        for iid, name, age, email in list_instructors():
-            instructors_tree.insert("", "end", values=(iid, name, age, email))
+        load_tree(instructors_tree, "instructors")
 
     def search_instructors():
         '''
@@ -814,8 +1081,8 @@ def run_app():
             instructor_search_entry - case-insensitive search text
 
         Behavior:
-            - If query present, show only matching rows where the query
-              appears in instructor id, name, or email.
+            - If query present, show only matching rows where every word of
+              the query starts a word of instructor id, name, or email.
             - If query empty, refresh to show all.
 
         Parameters:
@@ -824,14 +1091,11 @@ def run_app():
         Returns:
             None
         '''
-        q = instructor_search_entry.get().strip().lower()
-        instructors_tree.delete(*instructors_tree.get_children())
-        rows = list_instructors()
-        for iid, name, age, email in rows:
-            if q in iid.lower() or q in name.lower() or q in email.lower():
-                instructors_tree.insert("", "end", values=(iid, name, age, email))
+        q = instructor_search_entry.get().strip()
         if not q:
             refresh_instructors_tree()
+            return
+        show_rows(instructors_tree, find_instructors(q))
 
     def get_selected_instructor_id():
         '''
@@ -842,7 +1106,7 @@ def run_app():
         if not sel:
             messagebox.showwarning("Select an instructor", "Please select an instructor in the table.")
             return None
-        return instructors_tree.item(sel[0], "values")[0]
+        return sel[0]
 
     def edit_instructor_action():
         '''
@@ -905,18 +1169,14 @@ def run_app():
                 email = email_e.get().strip()
 
                 # Validation
-                if not name or not age_txt or not email:
-                    raise ValueError("All fields are required.")
-                if not age_txt.isdigit() or int(age_txt) < 0:
-                    raise ValueError("Age must be a non-negative integer.")
-                if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
-                    raise ValueError("Invalid email format.")
+                age = validate_person(name, age_txt, email)
 
                 # Update DB
-                update_instructor(iid, name=name, age=int(age_txt), email=email)
+                update_instructor(iid, name=name, age=age, email=email)
 
-                # Refresh UI components that might show instructor info
-                refresh_instructors_tree()
+                # Update the edited row; the courses table shows instructor names
+                instructors_tree.item(iid, values=(iid, name, age, email))
+                reload_if_loading(instructors_tree)
                 refresh_courses_tree()
                 win.destroy()
 
@@ -933,7 +1193,7 @@ def run_app():
             - Check selection
             - Confirm delete
             - Call delete_instructor(iid)
-            - Refresh instructors and courses and assignment lists
+            - Remove the instructor's row and refresh the courses table
 
         Parameters:
             None
@@ -947,9 +1207,10 @@ def run_app():
         if not messagebox.askyesno("Delete", f"Delete instructor {iid}?"):
             return
         delete_instructor(iid)
-        refresh_instructors_tree()
+        instructors_tree.delete(iid)
+        reload_if_loading(instructors_tree)
+        # Their courses stay, only without an instructor
         refresh_courses_tree()
-        update_assign_course_list()
 
     # Buttons for instructor actions
     instructors_btns = ttk.Frame(content)
@@ -975,7 +1236,7 @@ def run_app():
 
     def refresh_courses_tree():
         '''
-        Refresh the courses_tree with data from list_courses().
+        Refresh the courses_tree with the course list, loaded in the background.
 
         Each row expected format: (course_id, course_name, instructor_name_or_id)
 
@@ -985,9 +1246,7 @@ def run_app():
         Returns:
             None
         '''
-        courses_tree.delete(*courses_tree.get_children())
-        for cid, cname, iname in list_courses():
-            courses_tree.insert("", "end", values=(cid, cname, iname))
+        load_tree(courses_tree, "courses")
 
     def search_courses():
         '''
@@ -997,7 +1256,7 @@ def run_app():
             course_search_entry for query text
 
         Behavior:
-            - Show rows where query appears in course id, course name, or instructor name
+            - Show rows where every query word starts a word of course id, course name, or instructor name
             - If empty query, refresh to show all
 
         Parameters:
@@ -1006,14 +1265,11 @@ def run_app():
         Returns:
             None
         '''
-        q = course_search_entry.get().strip().lower()
-        courses_tree.delete(*courses_tree.get_children())
-        rows = list_courses()
-        for cid, cname, iname in rows:
-            if q in cid.lower() or q in cname.lower() or q in iname.lower():
-                courses_tree.insert("", "end", values=(cid, cname, iname))
+        q = course_search_entry.get().strip()
         if not q:
             refresh_courses_tree()
+            return
+        show_rows(courses_tree, find_courses(q))
 
     def get_selected_course_id():
         '''
@@ -1026,7 +1282,7 @@ def run_app():
         if not sel:
             messagebox.showwarning("Select a course", "Please select a course in the table.")
             return None
-        return courses_tree.item(sel[0], "values")[0]
+        return sel[0]
 
     def edit_course_action():
         '''
@@ -1038,7 +1294,7 @@ def run_app():
             - Provide fields to edit: course name and instructor id (via combobox)
             - Validate inputs: non-empty course name, instructor id if provided must exist
             - Call update_course(cid, course_name=new_name, instructor_id=new_iid_or_None)
-            - Refresh courses table
+            - Update the course's row in the courses table
 
         Parameters:
             None
@@ -1066,7 +1322,7 @@ def run_app():
 
         # Prefill instructor id in a combobox of instructor ids; allow empty string
         instr_var = tk.StringVar(value=(row[2] if row[2] else ""))
-        instr_box = ttk.Combobox(win, textvariable=instr_var, state="readonly", values=[i[0] for i in list_instructors()])
+        instr_box = ttk.Combobox(win, textvariable=instr_var, state="readonly", values=list_instructors_columnar()["instructor_id"])
         instr_box.grid(row=1, column=1, pady=4)
 
         def save():
@@ -1089,14 +1345,16 @@ def run_app():
                 if not new_name:
                     raise ValueError("Course name cannot be empty.")
                 # If instructor provided, ensure it exists
-                if new_iid and not read_instructor(new_iid):
+                instructor = read_instructor(new_iid) if new_iid else None
+                if new_iid and not instructor:
                     raise ValueError("Instructor ID not found.")
 
                 # Update DB: if new_iid empty -> pass None to clear assignment
                 update_course(cid, course_name=new_name, instructor_id=(new_iid if new_iid else None))
 
-                # Refresh and close
-                refresh_courses_tree()
+                # Update the edited row and close
+                courses_tree.item(cid, values=(cid, new_name, instructor[1] if instructor else ""))
+                reload_if_loading(courses_tree)
                 win.destroy()
 
             except Exception as e:
@@ -1112,7 +1370,7 @@ def run_app():
             - Get selected course id
             - Confirm deletion
             - Call delete_course(cid)
-            - Refresh courses table and dependent comboboxes
+            - Remove the course's row and refresh dependent comboboxes
 
         Parameters:
             None
@@ -1126,9 +1384,9 @@ def run_app():
         if not messagebox.askyesno("Delete", f"Delete course {cid}?"):
             return
         delete_course(cid)
-        refresh_courses_tree()
-        update_course_list()
-        update_assign_course_list()
+        courses_tree.delete(cid)
+        reload_if_loading(courses_tree)
+        update_course_choices()
 
     # Buttons for course actions
     courses_btns = ttk.Frame(content)
@@ -1141,16 +1399,23 @@ def run_app():
     refresh_students_tree()
     refresh_instructors_tree()
     refresh_courses_tree()
-    update_course_list()
-    update_assign_course_list()
+    update_course_choices()
+    # Pick up any rows loaded before mainloop could receive <<RowsLoaded>>
+    root.after_idle(on_rows_loaded)
 
     # Bind Enter key in search entries to execute searches
     student_search_entry.bind("<Return>", lambda e: search_students())
     instructor_search_entry.bind("<Return>", lambda e: search_instructors())
     course_search_entry.bind("<Return>", lambda e: search_courses())
 
+    # Live search while typing, once the user pauses for 150 ms
+    student_search_entry.bind("<KeyRelease>", debounce(student_search_entry, 150, search_students))
+    instructor_search_entry.bind("<KeyRelease>", debounce(instructor_search_entry, 150, search_instructors))
+    course_search_entry.bind("<KeyRelease>", debounce(course_search_entry, 150, search_courses))
+
     # Run the Tkinter main loop
     root.mainloop()
+    loader.shutdown(wait=False)
 
 
 # Entry point guard